@@ -7,8 +7,199 @@ loading table configurations, including column and row markers.
 
 import json
 import os
-import pandas as pd
-from tkinter import filedialog, messagebox
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# orjson is optional; it is considerably faster than the standard library for
+# large multi-page marker files, so use it when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj):
+    """
+    Serialise an object to indented JSON.
+    
+    Args:
+        obj: The object to serialise
+        
+    Returns:
+        bytes: The UTF-8 encoded JSON document
+    """
+    # Both encoders write the same layout (orjson only supports 2-space indentation)
+    # and accept the same input: plain dicts, lists, strings and numbers
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # Configurations are plain trees of dicts, lists and numbers, so the
+    # encoder's per-container circular-reference bookkeeping can be skipped
+    return json.dumps(obj, indent=2, ensure_ascii=False, check_circular=False).encode('utf-8')
+
+
+def _loads(data):
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: The JSON document as bytes
+        
+    Returns:
+        The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _file_mode(file_path):
+    """
+    Get the permission bits a file written to a path should have.
+    
+    Args:
+        file_path: Path of the file about to be written
+        
+    Returns:
+        int: The mode of the existing file, or 0o666 less the umask for a new one
+    """
+    try:
+        return os.stat(file_path).st_mode & 0o7777
+    except FileNotFoundError:
+        # The umask can only be read by setting it, so put it straight back
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _write_bytes(file_path, payload, *, sync=False):
+    """
+    Write bytes to a file atomically.
+    
+    The data is written to a temporary file in the same directory and then
+    renamed over the target, so an interrupted save never leaves a truncated file.
+    
+    Args:
+        file_path: Path of the file to write
+        payload: The bytes to write
+        sync: Whether to flush the data to disk before renaming (slower, but
+              survives a power failure)
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        
+        # mkstemp creates the file readable by its owner only; give it the permissions
+        # of the file it replaces, or those a normally created file would have
+        os.chmod(tmp_path, _file_mode(file_path))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass  # Already gone; report the original error instead
+        raise
+
+
+def _write_json(file_path, obj, *, sync=False):
+    """
+    Write an object to a JSON file atomically.
+    
+    Args:
+        file_path: Path of the file to write
+        obj: The object to serialise
+        sync: Whether to flush the data to disk before renaming
+    """
+    # Serialise up front so the file is written in a single call
+    _write_bytes(file_path, _dumps(obj), sync=sync)
+
+
+def _pool_page_markers(page_markers):
+    """
+    Store each distinct marker list once, with every page referring to it by index.
+    
+    Documents usually repeat the same column layout on every page, so this
+    keeps the saved file from growing with one copy of each list per page.
+    
+    Args:
+        page_markers: Dict mapping page indices to {'columns': array, 'rows': array}
+        
+    Returns:
+        tuple: (pool, index) where pool is a list of unique marker lists and index
+               maps each page (as a string) to {'columns': i, 'rows': j}
+    """
+    ids = {}
+    index = {}
+    for page, markers in page_markers.items():
+        index[str(page)] = {
+            axis: ids.setdefault(tuple(map(float, markers[axis])), len(ids))
+            for axis in ('columns', 'rows')
+        }
+    pool = [list(markers) for markers in ids]
+    return pool, index
+
+
+def _unpool_page_markers(pool, index):
+    """
+    Rebuild per-page markers from the output of _pool_page_markers.
+    
+    Args:
+        pool: List of unique marker lists
+        index: Dict mapping pages to {'columns': i, 'rows': j}
+        
+    Returns:
+        dict: Page markers keyed by integer page index
+    """
+    # Pages may share pool lists; each is copied into its own array when loaded
+    return {
+        int(page): {axis: pool[i] for axis, i in entry.items()}
+        for page, entry in index.items()
+    }
+
+
+def _read_json_file(file_path):
+    """
+    Read and parse a JSON file.
+    
+    Args:
+        file_path: Path to the JSON file
+        
+    Returns:
+        The parsed object
+    """
+    return _loads(Path(file_path).read_bytes())
+
+
+def _read_page_marker_file(file_path):
+    """
+    Read a multi-page marker file, converting page keys back to integers.
+    
+    Pooled markers are expanded back into 'page_markers'.
+    
+    Args:
+        file_path: Path to the JSON file
+        
+    Returns:
+        dict: The configuration, with integer keys for 'page_markers' and 'manual_data'
+    """
+    config = _read_json_file(file_path)
+    
+    # Convert string keys back to integers, reusing the parsed values as they are
+    for key in ('page_markers', 'manual_data'):
+        if key in config:
+            pages = config[key]
+            config[key] = dict(zip(map(int, pages), pages.values()))
+    
+    if 'marker_index' in config:
+        config['page_markers'] = _unpool_page_markers(config.pop('marker_pool'),
+                                                      config.pop('marker_index'))
+    
+    return config
+
 
 class ConfigManager:
     """
@@ -26,11 +217,25 @@ class ConfigManager:
             app: The PDFTableExtractorApp instance
         """
         self.app = app
+        
+        # Directory of the last configuration file, used as the dialogs' starting point
+        self._last_dir = os.getcwd()
+    
+    def _remember_dir(self, file_path):
+        """
+        Remember the directory of a chosen file for the next dialog.
+        
+        Args:
+            file_path: The path returned by the file dialog
+        """
+        self._last_dir = os.path.dirname(file_path) or self._last_dir
     
     def save_table_config(self):
         """
         Save the current table configuration (marker positions) to a JSON file.
         """
+        from tkinter import filedialog, messagebox
+        
         if not self.app.column_markers or not self.app.row_markers:
             messagebox.showwarning("Warning", "Please set column and row markers first")
             return
@@ -40,7 +245,7 @@ class ConfigManager:
             'column_markers': self.app.column_markers,
             'row_markers': self.app.row_markers,
             'page': self.app.current_page if self.app.pdf_document else 0,
-            'created_date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'created_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'description': 'Table configuration for PDF Table Extractor'
         }
         
@@ -48,13 +253,15 @@ class ConfigManager:
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            initialdir=self._last_dir,
             title="Save Table Configuration")
         
         if file_path:
+            self._remember_dir(file_path)
+            file_name = os.path.basename(file_path)
             try:
-                with open(file_path, 'w') as f:
-                    json.dump(config, f, indent=4)
-                self.app.status_label.config(text=f"Configuration saved to: {os.path.basename(file_path)}")
+                _write_json(file_path, config, sync=True)
+                self.app.status_label.config(text=f"Configuration saved to: {file_name}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save configuration: {str(e)}")
     
@@ -62,31 +269,38 @@ class ConfigManager:
         """
         Load a table configuration (marker positions) from a JSON file.
         """
+        from tkinter import filedialog, messagebox
+        
         file_path = filedialog.askopenfilename(
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            initialdir=self._last_dir,
             title="Load Table Configuration")
         
         if file_path:
+            self._remember_dir(file_path)
+            file_name = os.path.basename(file_path)
             try:
-                with open(file_path, 'r') as f:
-                    config = json.load(f)
+                config = _read_json_file(file_path)
                 
                 # Extract the markers from the configuration
                 if 'column_markers' in config and 'row_markers' in config:
-                    self.app.column_markers = config['column_markers']
-                    self.app.row_markers = config['row_markers']
+                    # Markers are kept sorted while they are edited
+                    self.app.column_markers = sorted(config['column_markers'])
+                    self.app.row_markers = sorted(config['row_markers'])
                     
-                    # Redraw markers
-                    self.app.marker_manager.redraw_markers()
-                    
-                    # Set page if available and PDF is loaded
-                    if self.app.pdf_document and 'page' in config:
-                        # Make sure the page is within valid range
-                        if 0 <= config['page'] < self.app.total_pages:
-                            self.app.current_page = config['page']
-                            self.app.pdf_handler.update_page_display()
+                    # Change page if the configuration was saved on another one
+                    # (make sure the page is within valid range)
+                    page = config.get('page', self.app.current_page)
+                    if (self.app.pdf_document and page != self.app.current_page
+                            and 0 <= page < self.app.total_pages):
+                        self.app.current_page = page
+                        
+                        # Updating the display redraws the markers
+                        self.app.pdf_handler.update_page_display()
+                    else:
+                        self.app.marker_manager.redraw_markers()
                     
-                    self.app.status_label.config(text=f"Configuration loaded from: {os.path.basename(file_path)}")
+                    self.app.status_label.config(text=f"Configuration loaded from: {file_name}")
                 else:
                     messagebox.showerror("Error", "Invalid configuration file")
                     
@@ -97,17 +311,25 @@ class ConfigManager:
         """
         Save all page markers and manual data to a JSON file for future use.
         """
+        from tkinter import filedialog, messagebox
+        
         if not self.app.page_markers:
             messagebox.showwarning("Warning", "No page markers to save")
             return
         
+        pdf_base = os.path.basename(self.app.pdf_document.name) if self.app.pdf_document else "Unknown"
+        
+        # Share identical marker lists between pages (keys become strings for JSON)
+        marker_pool, marker_index = _pool_page_markers(self.app.page_markers)
+        
         # Create a configuration dictionary
         config = {
-            'page_markers': {str(k): v for k, v in self.app.page_markers.items()},  # Convert keys to strings for JSON
+            'marker_pool': marker_pool,
+            'marker_index': marker_index,
             'manual_data': {},
-            'created_date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'created_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'description': 'Multi-page markers for PDF Table Extractor',
-            'filename': os.path.basename(self.app.pdf_document.name) if self.app.pdf_document else "Unknown"
+            'filename': pdf_base
         }
         
         # Add manual data if available
@@ -119,13 +341,15 @@ class ConfigManager:
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            initialdir=self._last_dir,
             title="Save All Page Markers")
         
         if file_path:
+            self._remember_dir(file_path)
+            file_name = os.path.basename(file_path)
             try:
-                with open(file_path, 'w') as f:
-                    json.dump(config, f, indent=4)
-                self.app.status_label.config(text=f"All page markers saved to: {os.path.basename(file_path)}")
+                _write_json(file_path, config, sync=True)
+                self.app.status_label.config(text=f"All page markers saved to: {file_name}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save page markers: {str(e)}")
     
@@ -133,30 +357,39 @@ class ConfigManager:
         """
         Load all page markers and manual data from a JSON file.
         """
+        from tkinter import filedialog, messagebox
+        
+        from core.marker_manager import to_marker_array
+        
+        pdf_base = os.path.basename(self.app.pdf_document.name) if self.app.pdf_document else "Unknown"
+        
         file_path = filedialog.askopenfilename(
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            initialdir=self._last_dir,
             title="Load All Page Markers")
         
         if file_path:
+            self._remember_dir(file_path)
+            file_name = os.path.basename(file_path)
             try:
-                with open(file_path, 'r') as f:
-                    config = json.load(f)
+                config = _read_page_marker_file(file_path)
                 
                 # Check if the current PDF filename matches the saved one
-                current_filename = os.path.basename(self.app.pdf_document.name) if self.app.pdf_document else "Unknown"
                 saved_filename = config.get('filename', "Unknown")
                 
-                if current_filename != saved_filename:
+                if pdf_base != saved_filename:
                     if not messagebox.askyesno("Warning", 
                                             f"This configuration was created for a different file: '{saved_filename}'\n\n"
-                                            f"Your current file is: '{current_filename}'\n\n"
+                                            f"Your current file is: '{pdf_base}'\n\n"
                                             "Load anyway? This might cause alignment issues."):
                         return
                 
                 # Extract the page markers from the configuration
                 if 'page_markers' in config:
-                    # Convert string keys back to integers
-                    page_markers = {int(k): v for k, v in config['page_markers'].items()}
+                    page_markers = {
+                        page: {axis: to_marker_array(values) for axis, values in markers.items()}
+                        for page, markers in config['page_markers'].items()
+                    }
                     self.app.page_markers = page_markers
                     
                     # Update the current page display if it's one of the marked pages
@@ -165,13 +398,12 @@ class ConfigManager:
                         self.app.marker_manager.redraw_markers()
                     
                     num_pages = len(page_markers)
-                    self.app.status_label.config(text=f"Loaded {num_pages} page markers from: {os.path.basename(file_path)}")
+                    self.app.status_label.config(text=f"Loaded {num_pages} page markers from: {file_name}")
                 
                 # Load manual data if available
                 if 'manual_data' in config and config['manual_data']:
                     if hasattr(self.app, 'manual_input_manager'):
-                        # Convert string keys back to integers
-                        manual_data = {int(k): v for k, v in config['manual_data'].items()}
+                        manual_data = config['manual_data']
                         self.app.manual_input_manager.all_pages_manual_data = manual_data
                         
                         # Notify user about loaded manual data
@@ -5,8 +5,11 @@ This module provides the ManualInputManager class, which enables manual entry
 of table cell contents when automatic extraction fails or produces poor results.
 """
 
+import bisect
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
+from gui.main_area import show_table_output
 
 class ManualInputManager:
     """
@@ -27,11 +30,24 @@ class ManualInputManager:
         self.manual_mode_active = False
         self.current_cell = (0, 0)  # (row, column)
         self.manual_table_data = None
-        self.cell_coordinates = None  # Will store bounding boxes for cells
+        self._rows = 0  # Shape of manual_table_data, set by _initialize_manual_input
+        self._cols = 0
+        self._owned = False  # False while manual_table_data is shared with the per-page store
+        self._sorted_col_markers = None  # Sorted cell boundaries in PDF space
+        self._sorted_row_markers = None
+        self._markers_stale = True  # Set by invalidate_markers() when the markers change
+        self._scaled_col_markers = None  # The same boundaries in canvas space at the current zoom
+        self._scaled_row_markers = None
         self.input_frame = None
         self.cell_text_entry = None
+        self._cell_text_var = None  # StringVar behind cell_text_entry
+        self._entry_modified = False  # True once the entry has changed since the cell was loaded
         self.cell_info_label = None
         self.highlighted_cell_id = None
+        self._pending_highlight = None  # after_idle id of a scheduled highlight redraw
+        self._canvas_size = None  # (width, height), kept current by <Configure>
+        self._restore_click = None  # Main area click handler, rebound on exit
+        self._stored_indicator_id = None  # Canvas item of the "Data Stored" indicator
         
         # Add storage for per-page manual data
         self.all_pages_manual_data = {}  # Dict to store data by page index
@@ -55,6 +71,11 @@ class ManualInputManager:
             # Start manual input mode
             self._initialize_manual_input()
             
+            # Resolve the main area click handler once, to restore it on exit
+            if self._restore_click is None:
+                from gui.main_area import _on_canvas_click
+                self._restore_click = lambda e: _on_canvas_click(self.app, e)
+            
             # Bind canvas click event for cell selection
             self.app.canvas.bind("<Button-1>", self._on_canvas_click)
             
@@ -64,7 +85,7 @@ class ManualInputManager:
             # Save the current page data before exiting
             if self.manual_table_data:
                 self._save_current_cell_content()  # Save any pending cell edits
-                self.all_pages_manual_data[self.app.current_page] = [row[:] for row in self.manual_table_data]  # Make a deep copy
+                self._store_page_data()
             
             # Exit manual input mode
             self._cleanup_manual_input()
@@ -73,46 +94,64 @@ class ManualInputManager:
         """
         Handle mouse click events in manual mode to select a cell.
         """
-        if not self.manual_mode_active or not self.cell_coordinates:
+        if not self.manual_mode_active or self._sorted_col_markers is None:
             return
         
         # Get the position in the document (accounting for zoom and scroll)
         x = int(self.app.canvas.canvasx(event.x) / self.app.zoom_factor)
         y = int(self.app.canvas.canvasy(event.y) / self.app.zoom_factor)
         
-        # Find which cell was clicked
-        for row in range(len(self.cell_coordinates)):
-            for col in range(len(self.cell_coordinates[0])):
-                left, top, right, bottom = self.cell_coordinates[row][col]
-                
-                if left <= x <= right and top <= y <= bottom:
-                    # Save current cell content before changing cells
-                    self._save_current_cell_content()
-                    
-                    # Update current cell and highlight
-                    self.current_cell = (row, col)
-                    self._highlight_current_cell()
-                    
-                    # Update status to indicate the selected cell
-                    self.app.status_label.config(text=f"Selected cell: ({row + 1}, {col + 1})")
-                    return
+        # Ignore clicks outside the table
+        col_markers = self._sorted_col_markers
+        row_markers = self._sorted_row_markers
+        if not (col_markers[0] <= x <= col_markers[-1] and row_markers[0] <= y <= row_markers[-1]):
+            return
+        
+        # Find which cell was clicked from the sorted cell boundaries
+        # (a click on a boundary belongs to the cell before it)
+        col = max(bisect.bisect_left(col_markers, x), 1) - 1
+        row = max(bisect.bisect_left(row_markers, y), 1) - 1
+        
+        # Save current cell content before changing cells
+        self._save_current_cell_content()
+        
+        # Update current cell and highlight
+        self.current_cell = (row, col)
+        self._highlight_current_cell()
+        
+        # Update status to indicate the selected cell
+        self.app.status_label.config(text=f"Selected cell: ({row + 1}, {col + 1})")
     
     def _initialize_manual_input(self):
         """
         Initialize the manual input interface.
         """
-        # Make sure we have a proper grid defined
-        sorted_col_markers = sorted(self.app.column_markers)
-        sorted_row_markers = sorted(self.app.row_markers)
+        # Cell bounds are read from the sorted markers, which are only
+        # re-sorted when the markers have changed since the last session
+        if self._markers_stale:
+            self._sorted_col_markers = sorted(self.app.column_markers)
+            self._sorted_row_markers = sorted(self.app.row_markers)
+            self._markers_stale = False
+        sorted_col_markers = self._sorted_col_markers
+        sorted_row_markers = self._sorted_row_markers
         
+        # Make sure we have a proper grid defined
         if len(sorted_col_markers) < 2 or len(sorted_row_markers) < 2:
             messagebox.showwarning("Warning", "Please define at least two column and two row markers")
             self.manual_mode_active = False
             return
         
+        self._update_scaled_markers()
+        
+        # Track the canvas size from resize events instead of querying it per highlight
+        if self._canvas_size is None:
+            self.app.canvas.bind("<Configure>", self._on_canvas_configure, add="+")
+            self._canvas_size = (self.app.canvas.winfo_width(), self.app.canvas.winfo_height())
+        
         # Calculate table dimensions
         rows = len(sorted_row_markers) - 1
         cols = len(sorted_col_markers) - 1
+        self._rows, self._cols = rows, cols
         
         # Check if we have existing data for this page
         current_page = self.app.current_page
@@ -120,26 +159,17 @@ class ManualInputManager:
             # Use existing data if dimensions match
             existing_data = self.all_pages_manual_data[current_page]
             if len(existing_data) == rows and len(existing_data[0]) == cols:
+                # Share the stored rows; the first edit takes a private copy
                 self.manual_table_data = existing_data
+                self._owned = False
             else:
                 # Dimensions don't match, create new data but keep old for reference
-                self.manual_table_data = [['' for _ in range(cols)] for _ in range(rows)]
+                self.manual_table_data = [[''] * cols for _ in range(rows)]
+                self._owned = True
         else:
             # Initialize or reset the manual table data if not found
-            self.manual_table_data = [['' for _ in range(cols)] for _ in range(rows)]
-                
-        # Calculate cell coordinates in PDF space
-        self.cell_coordinates = []
-        for r in range(rows):
-            row_coords = []
-            for c in range(cols):
-                # Get bounding box for this cell (left, top, right, bottom)
-                left = sorted_col_markers[c]
-                top = sorted_row_markers[r]
-                right = sorted_col_markers[c + 1]
-                bottom = sorted_row_markers[r + 1]
-                row_coords.append((left, top, right, bottom))
-            self.cell_coordinates.append(row_coords)
+            self.manual_table_data = [[''] * cols for _ in range(rows)]
+            self._owned = True
         
         # Set the first cell as the current one
         self.current_cell = (0, 0)
@@ -153,6 +183,46 @@ class ManualInputManager:
         # Update status
         self.app.status_label.config(text=f"Manual input mode active - {rows}x{cols} table")
     
+    def invalidate_markers(self):
+        """
+        Mark the cached sorted markers as out of date.
+        
+        Called whenever the column or row markers change; the markers are
+        re-sorted the next time manual input mode starts.
+        """
+        self._markers_stale = True
+    
+    def _update_scaled_markers(self):
+        """
+        Scale the sorted cell boundaries to canvas space at the current zoom level.
+        """
+        zoom = self.app.zoom_factor
+        self._scaled_col_markers = [m * zoom for m in self._sorted_col_markers]
+        self._scaled_row_markers = [m * zoom for m in self._sorted_row_markers]
+    
+    def invalidate_zoom_cache(self):
+        """
+        Refresh the canvas-space cell boundaries after the zoom level changes.
+        
+        If manual mode is active the highlight is redrawn at the new scale.
+        """
+        if self._sorted_col_markers is None:
+            return
+        
+        self._update_scaled_markers()
+        
+        if self.manual_mode_active and self._pending_highlight is None:
+            self._pending_highlight = self.app.root.after_idle(self._run_pending_highlight)
+    
+    def _on_canvas_configure(self, event):
+        """
+        Remember the canvas size when it is resized.
+        
+        Args:
+            event: The <Configure> event
+        """
+        self._canvas_size = (event.width, event.height)
+    
     def _create_input_interface(self):
         """
         Create the manual input interface at the bottom of the main window.
@@ -212,8 +282,10 @@ class ManualInputManager:
             # Label
             tk.Label(entry_frame, text="Cell Content:").pack(side=tk.LEFT, padx=5)
             
-            # Cell content entry
-            self.cell_text_entry = ttk.Entry(entry_frame, width=50)
+            # Cell content entry, with a trace noting when its text changes
+            self._cell_text_var = tk.StringVar(entry_frame)
+            self._cell_text_var.trace_add("write", self._on_entry_modified)
+            self.cell_text_entry = ttk.Entry(entry_frame, width=50, textvariable=self._cell_text_var)
             self.cell_text_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
             
             # Bind Return key to move to next cell
@@ -227,6 +299,15 @@ class ManualInputManager:
             # Focus on the entry
             self.cell_text_entry.focus_set()
     
+    def _on_entry_modified(self, *args):
+        """
+        Note that the cell text entry has changed.
+        
+        Args:
+            *args: The variable trace arguments (unused)
+        """
+        self._entry_modified = True
+    
     def _go_to_cell(self, row, col):
         """
         Navigate to a specific cell, ensuring boundaries are respected.
@@ -238,8 +319,7 @@ class ManualInputManager:
         self._save_current_cell_content()
         
         # Get table dimensions
-        rows = len(self.manual_table_data)
-        cols = len(self.manual_table_data[0]) if rows > 0 else 0
+        rows, cols = self._rows, self._cols
         
         # Ensure row and column are within bounds
         row = max(0, min(row, rows-1))
@@ -260,8 +340,14 @@ class ManualInputManager:
             self.input_frame.destroy()
             self.input_frame = None
             self.cell_text_entry = None
+            self._cell_text_var = None
             self.cell_info_label = None
         
+        # Drop any highlight redraw that has not run yet
+        if self._pending_highlight is not None:
+            self.app.root.after_cancel(self._pending_highlight)
+            self._pending_highlight = None
+        
         # Remove cell highlight
         if self.highlighted_cell_id:
             self.app.canvas.delete(self.highlighted_cell_id)
@@ -272,90 +358,112 @@ class ManualInputManager:
         
         # Restore the original canvas click handler based on the current selection mode
         # This ensures table drawing continues to work after exiting manual mode
-        if hasattr(self.app, 'canvas'):
-            from gui.main_area import _on_canvas_click
-            self.app.canvas.bind("<Button-1>", lambda e: _on_canvas_click(self.app, e))
+        if self._restore_click is not None:
+            self.app.canvas.bind("<Button-1>", self._restore_click)
         
         # Update status
         self.app.status_label.config(text="Manual input mode deactivated")
     
     def _highlight_current_cell(self):
         """
-        Highlight the current cell on the canvas.
+        Highlight the current cell and load its content into the text entry.
+        
+        The entry is updated straight away so edits always land in the right cell,
+        while the canvas redraw is deferred to the next idle moment. Rapid
+        navigation (e.g. a held arrow key) then costs one redraw instead of one per key.
         """
-        if not self.manual_mode_active or not self.cell_coordinates:
+        if not self.manual_mode_active or self._sorted_col_markers is None:
             return
         
-        # Clear previous highlight
-        if self.highlighted_cell_id:
-            self.app.canvas.delete(self.highlighted_cell_id)
-        
-        # Get current cell coordinates
         row, col = self.current_cell
-        if (0 <= row < len(self.cell_coordinates) and 
-            0 <= col < len(self.cell_coordinates[0])):
-            
-            left, top, right, bottom = self.cell_coordinates[row][col]
-            
-            # Scale for zoom
-            left_scaled = left * self.app.zoom_factor
-            top_scaled = top * self.app.zoom_factor
-            right_scaled = right * self.app.zoom_factor
-            bottom_scaled = bottom * self.app.zoom_factor
-            
-            # Draw highlight rectangle
-            self.highlighted_cell_id = self.app.canvas.create_rectangle(
-                left_scaled, top_scaled, right_scaled, bottom_scaled,
-                outline="yellow", width=3, dash=(5, 5), tags="manual_highlight"
-            )
-            
-            # Ensure the cell is visible by scrolling if needed
-            # Calculate the center of the cell
-            center_x = (left_scaled + right_scaled) / 2
-            center_y = (top_scaled + bottom_scaled) / 2
-            
-            # Get current visible area
-            canvas_width = self.app.canvas.winfo_width()
-            canvas_height = self.app.canvas.winfo_height()
-            visible_left = self.app.canvas.canvasx(0)
-            visible_top = self.app.canvas.canvasy(0)
-            visible_right = visible_left + canvas_width
-            visible_bottom = visible_top + canvas_height
-            
-            # Check if cell is outside visible area
-            x_offset = 0
-            y_offset = 0
-            
-            # If cell is to the right of visible area
-            if right_scaled > visible_right:
-                x_offset = right_scaled - visible_right + 20  # Add some padding
-            # If cell is to the left of visible area
-            elif left_scaled < visible_left:
-                x_offset = left_scaled - visible_left - 20  # Add some padding
-                
-            # If cell is below visible area
-            if bottom_scaled > visible_bottom:
-                y_offset = bottom_scaled - visible_bottom + 20  # Add some padding
-            # If cell is above visible area
-            elif top_scaled < visible_top:
-                y_offset = top_scaled - visible_top - 20  # Add some padding
-                
-            # Scroll if needed
-            if x_offset != 0 or y_offset != 0:
-                self.app.canvas.xview_scroll(int(x_offset / 10), "units")
-                self.app.canvas.yview_scroll(int(y_offset / 10), "units")
+        if 0 <= row < self._rows and 0 <= col < self._cols:
             
             # Update cell info label
             self.cell_info_label.config(text=f"Cell: ({row + 1}, {col + 1})")
             
-            # Load existing cell content into the text entry if available
-            if 0 <= row < len(self.manual_table_data) and 0 <= col < len(self.manual_table_data[0]):
-                content = self.manual_table_data[row][col]
-                self.cell_text_entry.delete(0, tk.END)
-                self.cell_text_entry.insert(0, content)
+            # Load existing cell content into the text entry
+            self.cell_text_entry.delete(0, tk.END)
+            self.cell_text_entry.insert(0, self.manual_table_data[row][col])
+            self._entry_modified = False
                 
             # Focus on the text entry
             self.cell_text_entry.focus_set()
+        
+        # Schedule the canvas redraw unless one is already pending
+        if self._pending_highlight is None:
+            self._pending_highlight = self.app.root.after_idle(self._run_pending_highlight)
+    
+    def _run_pending_highlight(self):
+        """
+        Run the scheduled canvas redraw for the current cell.
+        """
+        self._pending_highlight = None
+        self._draw_cell_highlight()
+    
+    def _draw_cell_highlight(self):
+        """
+        Draw the highlight rectangle around the current cell and scroll it into view.
+        """
+        if not self.manual_mode_active or self._sorted_col_markers is None:
+            return
+        
+        # Get current cell coordinates
+        row, col = self.current_cell
+        if not (0 <= row < self._rows and 0 <= col < self._cols):
+            # Hide the highlight while the current cell is outside the grid
+            if self.highlighted_cell_id:
+                self.app.canvas.itemconfig(self.highlighted_cell_id, state="hidden")
+            return
+        
+        # Cell bounds on the canvas at the current zoom
+        left_scaled = self._scaled_col_markers[col]
+        top_scaled = self._scaled_row_markers[row]
+        right_scaled = self._scaled_col_markers[col + 1]
+        bottom_scaled = self._scaled_row_markers[row + 1]
+        
+        # Move the highlight rectangle, creating it on first use
+        if self.highlighted_cell_id:
+            self.app.canvas.coords(self.highlighted_cell_id,
+                                   left_scaled, top_scaled, right_scaled, bottom_scaled)
+            self.app.canvas.itemconfig(self.highlighted_cell_id, state="normal")
+            # Keep it above the page image, which is recreated on page changes
+            self.app.canvas.tag_raise(self.highlighted_cell_id)
+        else:
+            self.highlighted_cell_id = self.app.canvas.create_rectangle(
+                left_scaled, top_scaled, right_scaled, bottom_scaled,
+                outline="yellow", width=3, dash=(5, 5), tags="manual_highlight"
+            )
+        
+        # Ensure the cell is visible by scrolling if needed
+        # Get current visible area
+        canvas_width, canvas_height = self._canvas_size
+        visible_left = self.app.canvas.canvasx(0)
+        visible_top = self.app.canvas.canvasy(0)
+        visible_right = visible_left + canvas_width
+        visible_bottom = visible_top + canvas_height
+        
+        # Check if cell is outside visible area
+        x_offset = 0
+        y_offset = 0
+        
+        # If cell is to the right of visible area
+        if right_scaled > visible_right:
+            x_offset = right_scaled - visible_right + 20  # Add some padding
+        # If cell is to the left of visible area
+        elif left_scaled < visible_left:
+            x_offset = left_scaled - visible_left - 20  # Add some padding
+            
+        # If cell is below visible area
+        if bottom_scaled > visible_bottom:
+            y_offset = bottom_scaled - visible_bottom + 20  # Add some padding
+        # If cell is above visible area
+        elif top_scaled < visible_top:
+            y_offset = top_scaled - visible_top - 20  # Add some padding
+            
+        # Scroll if needed
+        if x_offset != 0 or y_offset != 0:
+            self.app.canvas.xview_scroll(int(x_offset / 10), "units")
+            self.app.canvas.yview_scroll(int(y_offset / 10), "units")
     
     def _save_current_cell_content(self):
         """
@@ -364,15 +472,32 @@ class ManualInputManager:
         if not self.manual_mode_active or self.cell_text_entry is None:
             return
         
+        # Nothing to save if the entry is unchanged since the cell was loaded
+        if not self._entry_modified:
+            return
+        
         row, col = self.current_cell
-        if (0 <= row < len(self.manual_table_data) and 
-            0 <= col < len(self.manual_table_data[0])):
+        if 0 <= row < self._rows and 0 <= col < self._cols:
             
             # Get content from text entry
             content = self.cell_text_entry.get()
             
-            # Save to manual table data
-            self.manual_table_data[row][col] = content
+            # Save to manual table data, copying it first if it is still shared
+            if content != self.manual_table_data[row][col]:
+                if not self._owned:
+                    self.manual_table_data = [list(r) for r in self.manual_table_data]
+                    self._owned = True
+                self.manual_table_data[row][col] = content
+    
+    def _store_page_data(self):
+        """
+        Store the manual table data for the current page.
+        
+        The table is stored by reference and shared from then on, so the next
+        edit copies it rather than changing the stored version.
+        """
+        self.all_pages_manual_data[self.app.current_page] = self.manual_table_data
+        self._owned = False
     
     def _go_to_next_cell(self):
         """
@@ -385,8 +510,7 @@ class ManualInputManager:
         self._save_current_cell_content()
         
         row, col = self.current_cell
-        cols = len(self.manual_table_data[0]) if self.manual_table_data else 0
-        rows = len(self.manual_table_data) if self.manual_table_data else 0
+        rows, cols = self._rows, self._cols
         
         # Move to next cell (right or down to next row)
         col += 1
@@ -414,8 +538,7 @@ class ManualInputManager:
         self._save_current_cell_content()
         
         row, col = self.current_cell
-        cols = len(self.manual_table_data[0]) if self.manual_table_data else 0
-        rows = len(self.manual_table_data) if self.manual_table_data else 0
+        rows, cols = self._rows, self._cols
         
         # Move to previous cell (left or up to previous row)
         col -= 1
@@ -451,29 +574,44 @@ class ManualInputManager:
         self._save_current_cell_content()
         
         # Store the manual table data for the current page
-        self.all_pages_manual_data[self.app.current_page] = [row[:] for row in self.manual_table_data]  # Make a deep copy
+        self._store_page_data()
         
         # Update status
-        rows = len(self.manual_table_data)
-        cols = len(self.manual_table_data[0]) if self.manual_table_data else 0
+        rows, cols = self._rows, self._cols
         self.app.status_label.config(text=f"Stored {rows}x{cols} table for page {self.app.current_page + 1}")
         
         # Add visual indicator that the page data is stored
-        self._update_data_stored_indicator()
+        self.show_data_stored_indicator()
         
-    def _update_data_stored_indicator(self):
+    def show_data_stored_indicator(self, visible=True):
         """
-        Add visual indicator that the page data is stored.
-        """
-        self.app.canvas.delete("page_data_stored_indicator")
-        self.app.canvas.create_text(
-            self.app.canvas.winfo_width() - 10, 10,
-            text="✓ Data Stored",
-            font=("Arial", 10),
-            fill="#FFD700",  # Gold color
-            anchor="ne",
-            tags="page_data_stored_indicator"
-        )
+        Show or hide the visual indicator that the page data is stored.
+        
+        The indicator is created once and afterwards only moved or hidden.
+        
+        Args:
+            visible: Whether the indicator should be shown
+        """
+        indicator = self._stored_indicator_id
+        if indicator is None or not self.app.canvas.type(indicator):
+            if visible:
+                self._stored_indicator_id = self.app.canvas.create_text(
+                    self.app.canvas.winfo_width() - 10, 10,
+                    text="✓ Data Stored",
+                    font=("Arial", 10),
+                    fill="#FFD700",  # Gold color
+                    anchor="ne",
+                    tags="page_data_stored_indicator"
+                )
+            return
+        
+        if visible:
+            self.app.canvas.coords(indicator, self.app.canvas.winfo_width() - 10, 10)
+            self.app.canvas.itemconfig(indicator, state="normal")
+            # Keep it above the page image, which is recreated on page changes
+            self.app.canvas.tag_raise(indicator)
+        else:
+            self.app.canvas.itemconfig(indicator, state="hidden")
     
     def exit_manual_mode_and_store_data(self):
         """
@@ -487,7 +625,7 @@ class ManualInputManager:
         
         # Store the data for the current page
         if self.manual_table_data:
-            self.all_pages_manual_data[self.app.current_page] = [row[:] for row in self.manual_table_data]
+            self._store_page_data()
             
         # Exit manual mode
         self.manual_mode_active = False
@@ -507,27 +645,21 @@ class ManualInputManager:
         self._save_current_cell_content()
         
         # Store the current page's data in all_pages_manual_data
-        self.all_pages_manual_data[self.app.current_page] = [row[:] for row in self.manual_table_data]
-        
-        # Set as the current table data in the main app
-        self.app.table_data = self.manual_table_data
+        self._store_page_data()
         
-        # Format table as CSV for display
-        csv_data = ""
-        for row in self.manual_table_data:
-            csv_data += ",".join(f'"{cell}"' if cell else "" for cell in row) + "\n"
+        # Set as the current table data in the main app (orientation
+        # correction edits it in place, so it must not share the stored rows)
+        self.app.table_data = [list(row) for row in self.manual_table_data]
         
-        # Display in the text output area
-        self.app.text_output.delete(1.0, "end")
-        self.app.text_output.insert("end", csv_data)
+        # Display the table as CSV in the text output area
+        show_table_output(self.app, self.manual_table_data)
         
         # Exit manual mode
         self.manual_mode_active = False
         self._cleanup_manual_input()
         
         # Update status
-        rows = len(self.manual_table_data)
-        cols = len(self.manual_table_data[0]) if self.manual_table_data else 0
+        rows, cols = self._rows, self._cols
         self.app.status_label.config(text=f"Manual table entry complete: {rows}x{cols} table")
 
     def extract_all_marked_pages(self):
@@ -548,10 +680,9 @@ class ManualInputManager:
         self._save_current_cell_content()
         
         # Store the current page's manual data if it exists
-        current_page = self.app.current_page
         if hasattr(self, 'manual_table_data') and self.manual_table_data:
             # Save current page data
-            self.all_pages_manual_data[current_page] = self.manual_table_data
+            self._store_page_data()
         
         # Ask for merge options using a dialog similar to the one in table_extractor
         from gui.dialogs import create_multipage_options_dialog
@@ -564,56 +695,55 @@ class ManualInputManager:
         do_transpose = options['transpose']
         
         try:
-            # Create progress window
-            from gui.dialogs import create_progress_dialog, update_progress
-            progress_window, progress_label, progress_bar = create_progress_dialog(
-                self.app, 
-                "Extracting tables...", 
-                "Extracting tables from marked pages..."
-            )
-            
-            # Calculate total pages
-            total_pages = len(self.app.page_markers)
-            
-            progress_window.update()
-            
-            # Extract tables from each marked page
-            all_tables = []
             marked_pages = sorted(self.app.page_markers.keys())
             
-            for i, page_idx in enumerate(marked_pages):
-                # Update progress
-                progress_ratio = (i + 1) / total_pages
-                update_progress(
-                    progress_bar, 
-                    progress_label,
-                    f"Extracting page {page_idx + 1} ({i + 1}/{len(marked_pages)})...",
-                    progress_ratio
+            # Pages without manual data get an empty table built from their markers
+            missing = [p for p in marked_pages if p not in self.all_pages_manual_data]
+            empty_tables = {}
+            
+            # Only show progress when there are pages to build
+            if missing:
+                from gui.dialogs import create_progress_dialog, update_progress
+                progress_window, progress_label, progress_bar = create_progress_dialog(
+                    self.app, 
+                    "Extracting tables...", 
+                    "Extracting tables from marked pages..."
                 )
+                last_update = time.monotonic()
                 
-                # Check if we have manual data for this page
-                if page_idx in self.all_pages_manual_data:
-                    # Use the manual data we've already collected
-                    page_table = self.all_pages_manual_data[page_idx]
-                    all_tables.append(page_table)
-                else:
+                for i, page_idx in enumerate(missing):
+                    # Update progress at most every 30ms, and always for the last page
+                    now = time.monotonic()
+                    if now - last_update > 0.03 or i == len(missing) - 1:
+                        progress_ratio = (i + 1) / len(missing)
+                        update_progress(
+                            progress_bar, 
+                            progress_label,
+                            f"Extracting page {page_idx + 1} ({i + 1}/{len(missing)})...",
+                            progress_ratio
+                        )
+                        last_update = now
+                    
                     # Load this page's markers
                     page_marker_data = self.app.page_markers[page_idx]
                     
-                    # Create empty table data for this page based on its markers
-                    sorted_col_markers = sorted(page_marker_data['columns'])
-                    sorted_row_markers = sorted(page_marker_data['rows'])
-                    
                     # Number of columns and rows is the number of cells between markers
-                    cols = len(sorted_col_markers) - 1 if len(sorted_col_markers) > 1 else 1
-                    rows = len(sorted_row_markers) - 1 if len(sorted_row_markers) > 1 else 1
+                    num_cols = len(page_marker_data['columns'])
+                    num_rows = len(page_marker_data['rows'])
+                    cols = num_cols - 1 if num_cols > 1 else 1
+                    rows = num_rows - 1 if num_rows > 1 else 1
                     
                     # Create an empty table
-                    empty_table = [['' for _ in range(cols)] for _ in range(rows)]
-                    all_tables.append(empty_table)
-            
-            # Close progress window
-            progress_window.destroy()
+                    empty_tables[page_idx] = [[''] * cols for _ in range(rows)]
+                
+                # Close progress window
+                progress_window.destroy()
+            
+            # Use the manual data we've already collected wherever it exists
+            all_tables = [
+                self.all_pages_manual_data[p] if p in self.all_pages_manual_data else empty_tables[p]
+                for p in marked_pages
+            ]
                         
             if not all_tables:
                 messagebox.showwarning("Warning", "No tables could be extracted from the marked pages.")
@@ -625,27 +755,18 @@ class ManualInputManager:
             else:  # horizontal
                 merged_table = self.app.table_extractor.merge_tables_horizontally(all_tables)
             
-            # Transpose if requested
+            # Transpose if requested (merged tables are rectangular, so no padding is needed)
             if do_transpose:
-                # Create a padded table to ensure all rows have the same length
-                max_cols = max(len(row) for row in merged_table)
-                padded_table = [row + [''] * (max_cols - len(row)) for row in merged_table]
-                merged_table = list(map(list, zip(*padded_table)))
+                merged_table = list(map(list, zip(*merged_table)))
             
             # Set as the current table data
             self.app.table_data = merged_table
             
-            # Format table as CSV for display
-            csv_data = ""
-            for row in merged_table:
-                csv_data += ",".join(f'"{cell}"' if cell else "" for cell in row) + "\n"
-            
-            # Display in the text output area
-            self.app.text_output.delete(1.0, "end")
-            self.app.text_output.insert("end", csv_data)
+            # Display the table as CSV in the text output area
+            show_table_output(self.app, merged_table)
             
             rows = len(merged_table)
-            cols = max(len(row) for row in merged_table) if merged_table else 0
+            cols = len(merged_table[0]) if merged_table else 0
             page_range = ", ".join(str(p + 1) for p in marked_pages)
             
             # Update status
@@ -659,58 +780,3 @@ class ManualInputManager:
             import traceback
             print(traceback.format_exc())
             messagebox.showerror("Error", f"Failed to extract from marked pages: {str(e)}")
-            
-    def _merge_tables_vertically(self, tables):
-        """
-        Merge multiple tables by stacking them vertically.
-        
-        Args:
-            tables: A list of table data (each table is a 2D list)
-            
-        Returns:
-            list: The merged table data
-        """
-        if not tables:
-            return []
-            
-        merged = []
-        for table in tables:
-            merged.extend(table)
-        return merged
-    
-    def _merge_tables_horizontally(self, tables):
-        """
-        Merge multiple tables by appending them horizontally.
-        
-        Args:
-            tables: A list of table data (each table is a 2D list)
-            
-        Returns:
-            list: The merged table data
-        """
-        if not tables:
-            return []
-        
-        # Find the maximum row count across all tables
-        max_rows = max(len(table) for table in tables)
-        
-        # Pad tables to have the same number of rows
-        padded_tables = []
-        for table in tables:
-            # Ensure all rows in the table have the same length
-            cols = max(len(row) for row in table) if table else 0
-            padded_table = [row + [''] * (cols - len(row)) for row in table]
-            
-            # Pad the table to have max_rows rows
-            padded_table.extend([[''] * cols for _ in range(max_rows - len(padded_table))])
-            padded_tables.append(padded_table)
-        
-        # Merge the padded tables horizontally
-        merged = []
-        for row_idx in range(max_rows):
-            merged_row = []
-            for table in padded_tables:
-                merged_row.extend(table[row_idx])
-            merged.append(merged_row)
-        
-        return merged
\ No newline at end of file
@@ -5,8 +5,46 @@ This module provides the MarkerManager class, which is responsible for managing
 row and column markers used to define table structures in PDF documents.
 """
 
+import bisect
+import math
 from tkinter import messagebox
 
+import numpy as np
+from PIL import Image, ImageDraw, ImageTk
+
+
+def to_marker_array(markers):
+    """
+    Copy a sequence of marker positions into the array form kept in page_markers.
+    
+    Args:
+        markers: A list or array of marker positions
+        
+    Returns:
+        numpy.ndarray: A contiguous, sorted float64 copy of the markers
+    """
+    return np.sort(np.array(markers, dtype=np.float64))
+
+
+def cell_indices(markers, values):
+    """
+    Find which of the cells between markers each of a batch of positions falls in.
+    
+    A position belongs to cell i when markers[i] <= value < markers[i + 1].
+    
+    Args:
+        markers: The marker positions along one axis
+        values: Sequence of positions along the same axis
+        
+    Returns:
+        numpy.ndarray: The cell index of each position, or -1 if it lies outside all cells
+    """
+    bounds = np.sort(np.asarray(markers, dtype=np.float64))
+    indices = np.searchsorted(bounds, np.asarray(values, dtype=np.float64), side='right') - 1
+    indices[indices >= len(bounds) - 1] = -1
+    return indices
+
+
 class MarkerManager:
     """
     Manages row and column markers for table extraction.
@@ -23,75 +61,247 @@ class MarkerManager:
             app: The PDFTableExtractorApp instance
         """
         self.app = app
+        self._intersection_image = None  # Keeps the intersection overlay from being garbage collected
+        self._line_ids = {'column': {}, 'row': {}}  # Marker position -> canvas line id
+        self._last_drawn_state = None  # What the last full redraw put on the canvas
+        self._marked_indicator_id = None  # Canvas item of the "Page Marked" indicator
+    
+    def _drawn_state(self):
+        """
+        Describe everything a full redraw depends on.
+        
+        The area selection is left out: it is redrawn on its own by draw_area_selection,
+        so dragging a selection never rebuilds the markers and intersection overlay.
+        
+        Returns:
+            tuple: A value that compares equal whenever a redraw would draw the same items
+        """
+        photo = self.app.photo
+        return (
+            self.app.pdf_document is not None,
+            (photo.width(), photo.height()) if photo else None,
+            self.app.zoom_factor,
+            tuple(self.app.column_markers),
+            tuple(self.app.row_markers)
+        )
     
     def redraw_markers(self):
         """
         Redraw all markers on the canvas.
+        
+        Only the area selection is redrawn if the canvas already shows the current
+        markers, which saves the second redraw after a zoom or page change that
+        leaves them as they were.
         """
-        # Clear existing lines and highlights
-        self.app.canvas.delete("marker")
-        self.app.canvas.delete("table_highlight")
-        self.app.canvas.delete("intersection")
-        self.app.canvas.delete("area_selection")
+        state = self._drawn_state()
+        if state == self._last_drawn_state:
+            self.draw_area_selection()
+            return
+        self._last_drawn_state = state
+        
+        # Markers are redrawn after every change, so drop manual input's sorted copy
+        self.app.manual_input_manager.invalidate_markers()
+        
+        # Bind what the loops below use to locals, as there can be many markers
+        canvas = self.app.canvas
+        create_line = canvas.create_line
+        zoom = self.app.zoom_factor
+        
+        # Clear existing lines and highlights; every marker overlay also carries
+        # the "dyn" tag, so one delete clears them all
+        canvas.delete("dyn")
+        
+        column_ids = {}
+        row_ids = {}
+        self._line_ids = {'column': column_ids, 'row': row_ids}
         
-        # Get canvas dimensions
         if not self.app.pdf_document:
             return
-            
-        canvas_height = self.app.photo.height()
-        canvas_width = self.app.photo.width()
+        
+        width = self.app.photo.width()
+        height = self.app.photo.height()
         
         # Draw column markers (vertical lines)
         for x in self.app.column_markers:
-            x_scaled = x * self.app.zoom_factor
-            self.app.canvas.create_line(
-                x_scaled, 0, x_scaled, canvas_height,
-                fill="blue", width=2, tags="marker"
-            )
+            scaled = x * zoom
+            column_ids[x] = create_line(scaled, 0, scaled, height,
+                                        fill="blue", width=2, tags=("marker", "dyn"))
         
         # Draw row markers (horizontal lines)
         for y in self.app.row_markers:
-            y_scaled = y * self.app.zoom_factor
-            self.app.canvas.create_line(
-                0, y_scaled, canvas_width, y_scaled,
-                fill="red", width=2, tags="marker"
-            )
+            scaled = y * zoom
+            row_ids[y] = create_line(0, scaled, width, scaled,
+                                     fill="red", width=2, tags=("marker", "dyn"))
             
-        # Draw intersection points to make it easier to see the grid
-        for x in self.app.column_markers:
-            for y in self.app.row_markers:
-                x_scaled = x * self.app.zoom_factor
-                y_scaled = y * self.app.zoom_factor
-                self.app.canvas.create_oval(
-                    x_scaled-4, y_scaled-4, x_scaled+4, y_scaled+4,
-                    fill="purple", outline="white", tags="intersection"
-                )
-        
-        # If we have at least 2 column and 2 row markers, highlight the table area
-        if len(self.app.column_markers) >= 2 and len(self.app.row_markers) >= 2:
-            min_x = min(self.app.column_markers)
-            max_x = max(self.app.column_markers)
-            min_y = min(self.app.row_markers)
-            max_y = max(self.app.row_markers)
-            self.highlight_table_area(min_x, min_y, max_x, max_y)
+        # Draw the intersections and table outline
+        self._draw_grid()
             
         # Draw area selection if exists
-        if self.app.selection_start and self.app.selection_end:
+        self.draw_area_selection()
+    
+    def draw_area_selection(self):
+        """
+        Redraw the area selection rectangle, leaving every other canvas item alone.
+        
+        Called on every mouse movement while an area is dragged out.
+        """
+        self.app.canvas.delete("area_selection")
+        
+        if self.app.pdf_document and self.app.selection_start and self.app.selection_end:
             x1, y1 = self.app.selection_start
             x2, y2 = self.app.selection_end
+            zoom = self.app.zoom_factor
             
-            # Scale coordinates to account for zoom
-            x1_scaled = x1 * self.app.zoom_factor
-            y1_scaled = y1 * self.app.zoom_factor
-            x2_scaled = x2 * self.app.zoom_factor
-            y2_scaled = y2 * self.app.zoom_factor
-            
-            # Create rectangle for area selection
+            # Create rectangle for area selection, scaled to account for zoom
             self.app.canvas.create_rectangle(
-                x1_scaled, y1_scaled, x2_scaled, y2_scaled,
-                outline="yellow", width=2, dash=(5, 5), tags="area_selection"
+                x1 * zoom, y1 * zoom, x2 * zoom, y2 * zoom,
+                outline="yellow", width=2, dash=(5, 5), tags=("area_selection", "dyn")
             )
     
+    def add_marker(self, marker_type, value):
+        """
+        Add a column or row marker, drawing only what the new marker changes.
+        
+        Args:
+            marker_type: Either 'column' or 'row'
+            value: The marker position in PDF coordinates
+            
+        Returns:
+            bool: True if the marker was added, False if it already existed
+        """
+        markers = self.app.column_markers if marker_type == 'column' else self.app.row_markers
+        
+        # Markers are always kept sorted, so a binary search finds duplicates
+        index = bisect.bisect_left(markers, value)
+        if index < len(markers) and markers[index] == value:
+            return False
+        
+        # Add to history for undo
+        self.app.marker_history.append({'type': marker_type, 'value': value})
+        
+        markers.insert(index, value)
+        
+        self._draw_marker_line(marker_type, value)
+        self._redraw_grid()
+        self._last_drawn_state = None
+        return True
+    
+    def _draw_marker_line(self, marker_type, value):
+        """
+        Draw the line for a single marker and remember its canvas item.
+        
+        Args:
+            marker_type: Either 'column' or 'row'
+            value: The marker position in PDF coordinates
+        """
+        scaled = value * self.app.zoom_factor
+        if marker_type == 'column':
+            line_id = self.app.canvas.create_line(
+                scaled, 0, scaled, self.app.photo.height(),
+                fill="blue", width=2, tags=("marker", "dyn")
+            )
+        else:
+            line_id = self.app.canvas.create_line(
+                0, scaled, self.app.photo.width(), scaled,
+                fill="red", width=2, tags=("marker", "dyn")
+            )
+        self._line_ids[marker_type][value] = line_id
+    
+    def _erase_marker_line(self, marker_type, value):
+        """
+        Remove the line of a marker that has been taken out of the marker list.
+        
+        Args:
+            marker_type: Either 'column' or 'row'
+            value: The marker position in PDF coordinates
+        """
+        markers = self.app.column_markers if marker_type == 'column' else self.app.row_markers
+        if value in markers:
+            return  # A duplicate marker at the same position still needs the line
+        
+        line_id = self._line_ids[marker_type].pop(value, None)
+        if line_id is not None:
+            self.app.canvas.delete(line_id)
+    
+    def _draw_grid(self):
+        """
+        Draw the items that depend on all markers together: the intersection dots
+        and, with at least 2 column and 2 row markers, the table area highlight.
+        """
+        # Draw intersection points to make it easier to see the grid
+        self._draw_intersections()
+        
+        # If we have at least 2 column and 2 row markers, highlight the table area
+        if len(self.app.column_markers) >= 2 and len(self.app.row_markers) >= 2:
+            # The markers are sorted, so the outermost ones are at the ends
+            min_x = self.app.column_markers[0]
+            max_x = self.app.column_markers[-1]
+            min_y = self.app.row_markers[0]
+            max_y = self.app.row_markers[-1]
+            self.highlight_table_area(min_x, min_y, max_x, max_y)
+    
+    def _redraw_grid(self):
+        """
+        Redraw the intersections and table highlight after a single marker change.
+        """
+        # The markers changed, so drop manual input's sorted copy
+        self.app.manual_input_manager.invalidate_markers()
+        
+        self.app.canvas.delete("intersection")
+        self.app.canvas.delete("table_highlight")
+        self._draw_grid()
+    
+    def scale_markers(self, ratio):
+        """
+        Move the markers drawn on the canvas to a new zoom level without recreating them.
+        
+        Args:
+            ratio: The new zoom factor divided by the old one
+        """
+        for tag in ("marker", "table_highlight", "area_selection"):
+            self.app.canvas.scale(tag, 0, 0, ratio, ratio)
+        
+        # The intersection overlay is an image, which canvas.scale cannot resize
+        self.app.canvas.delete("intersection")
+        self._draw_intersections()
+        self._last_drawn_state = None
+    
+    def _draw_intersections(self):
+        """
+        Draw a dot at every column and row marker intersection.
+        
+        The dots are stamped into one transparent image covering the grid, so the
+        canvas gets a single item rather than one oval per intersection.
+        """
+        if not self.app.column_markers or not self.app.row_markers:
+            self._intersection_image = None
+            return
+        
+        # Scale every marker once rather than per intersection
+        xs = np.asarray(self.app.column_markers, dtype=np.float64) * self.app.zoom_factor
+        ys = np.asarray(self.app.row_markers, dtype=np.float64) * self.app.zoom_factor
+        
+        # Image origin on the canvas, leaving room for the dots around the grid
+        left = math.floor(xs.min()) - 5
+        top = math.floor(ys.min()) - 5
+        width = math.ceil(xs.max()) - left + 6
+        height = math.ceil(ys.max()) - top + 6
+        
+        # Dot centres relative to the image origin
+        xs = (xs - left).tolist()
+        ys = (ys - top).tolist()
+        
+        overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+        for x in xs:
+            for y in ys:
+                draw.ellipse([x-4, y-4, x+4, y+4], fill="purple", outline="white")
+        
+        self._intersection_image = ImageTk.PhotoImage(overlay)
+        self.app.canvas.create_image(
+            left, top, anchor="nw", image=self._intersection_image, tags=("intersection", "dyn")
+        )
+    
     def highlight_table_area(self, min_x, min_y, max_x, max_y):
         """
         Highlight the table area on the canvas based on the min/max coordinates.
@@ -117,12 +327,14 @@ class MarkerManager:
         # Draw table border
         self.app.canvas.create_rectangle(
             min_x_scaled, min_y_scaled, max_x_scaled, max_y_scaled,
-            outline="green", width=3, tags="table_highlight"
+            outline="green", width=3, tags=("table_highlight", "dyn")
         )
         
-        # Count the actual cells (not the markers)
-        col_count = len([m for m in self.app.column_markers if min_x < m < max_x]) + 1
-        row_count = len([m for m in self.app.row_markers if min_y < m < max_y]) + 1
+        # Count the actual cells (not the markers) from the markers strictly inside the area
+        cols = self.app.column_markers
+        rows = self.app.row_markers
+        col_count = max(bisect.bisect_left(cols, max_x) - bisect.bisect_right(cols, min_x), 0) + 1
+        row_count = max(bisect.bisect_left(rows, max_y) - bisect.bisect_right(rows, min_y), 0) + 1
         
         self.app.canvas.create_text(
             min_x_scaled + 5,
@@ -130,7 +342,7 @@ class MarkerManager:
             text=f"Table: {row_count}x{col_count}",
             fill="green",
             anchor="sw",
-            tags="table_highlight"
+            tags=("table_highlight", "dyn")
         )
     
     def save_page_markers(self):
@@ -148,10 +360,11 @@ class MarkerManager:
         # Check if updating existing markers
         updating = self.app.current_page in self.app.page_markers
         
-        # Store markers for the current page
+        # Store markers for the current page as float64 arrays, which take far
+        # less memory than lists of floats when hundreds of pages are marked
         self.app.page_markers[self.app.current_page] = {
-            'columns': self.app.column_markers.copy(),
-            'rows': self.app.row_markers.copy()
+            'columns': to_marker_array(self.app.column_markers),
+            'rows': to_marker_array(self.app.row_markers)
         }
         
         # Update status
@@ -162,15 +375,34 @@ class MarkerManager:
             self.app.status_label.config(text=f"Markers saved for page {self.app.current_page + 1}. Total marked pages: {marked_pages}")
             
         # Add visual indicator that the page is marked
-        self.app.canvas.delete("page_marked_indicator")
-        self.app.canvas.create_text(
-            10, 10,
-            text="✓ Page Marked",
-            font=("Arial", 10),
-            fill="green",
-            anchor="nw",
-            tags="page_marked_indicator"
-        )
+        self.show_page_marked_indicator()
+    
+    def show_page_marked_indicator(self, visible=True):
+        """
+        Show or hide the visual indicator that the current page has saved markers.
+        
+        The indicator is created once and afterwards only shown or hidden.
+        
+        Args:
+            visible: Whether the indicator should be shown
+        """
+        indicator = self._marked_indicator_id
+        if indicator is None or not self.app.canvas.type(indicator):
+            if visible:
+                self._marked_indicator_id = self.app.canvas.create_text(
+                    10, 10,
+                    text="✓ Page Marked",
+                    font=("Arial", 10),
+                    fill="green",
+                    anchor="nw",
+                    tags="page_marked_indicator"
+                )
+            return
+        
+        if visible:
+            self.app.canvas.itemconfig(indicator, state="normal")
+        else:
+            self.app.canvas.itemconfig(indicator, state="hidden")
     
     def clear_page_markers(self):
         """
@@ -195,23 +427,25 @@ class MarkerManager:
         
         # Get the last marker added
         last_marker = self.app.marker_history.pop()
+        removed = False
         
-        # Remove the marker based on type
-        if last_marker['type'] == 'column':
-            try:
-                self.app.column_markers.remove(last_marker['value'])
-                self.app.status_label.config(text=f"Removed column marker at x={last_marker['value']}")
-            except ValueError:
-                self.app.status_label.config(text="Could not remove marker (not found)")
-        elif last_marker['type'] == 'row':
-            try:
-                self.app.row_markers.remove(last_marker['value'])
-                self.app.status_label.config(text=f"Removed row marker at y={last_marker['value']}")
-            except ValueError:
-                self.app.status_label.config(text="Could not remove marker (not found)")
-        
-        # Redraw markers
-        self.redraw_markers()
+        # Remove the marker from the list for its type
+        markers, axis = {
+            'column': (self.app.column_markers, 'x'),
+            'row': (self.app.row_markers, 'y')
+        }[last_marker['type']]
+        try:
+            markers.remove(last_marker['value'])
+            removed = True
+            self.app.status_label.config(text=f"Removed {last_marker['type']} marker at {axis}={last_marker['value']}")
+        except ValueError:
+            self.app.status_label.config(text="Could not remove marker (not found)")
+        
+        # Remove only the marker's line, then redraw what depends on all markers
+        if removed and self.app.pdf_document:
+            self._erase_marker_line(last_marker['type'], last_marker['value'])
+            self._redraw_grid()
+            self._last_drawn_state = None
     
     def clear_lines(self):
         """
@@ -231,22 +465,17 @@ class MarkerManager:
         """
         if self.app.current_page in self.app.page_markers:
             page_marker_data = self.app.page_markers[self.app.current_page]
-            self.app.column_markers = page_marker_data['columns']
-            self.app.row_markers = page_marker_data['rows']
+            # Markers being edited are kept as lists; the saved arrays stay untouched
+            self.app.column_markers = page_marker_data['columns'].tolist()
+            self.app.row_markers = page_marker_data['rows'].tolist()
             
             # Show indicator that this page has saved markers
-            self.app.canvas.create_text(
-                10, 10,
-                text="✓ Page Marked",
-                font=("Arial", 10),
-                fill="green",
-                anchor="nw",
-                tags="page_marked_indicator"
-            )
+            self.show_page_marked_indicator()
         else:
             # Clear markers when moving to a page without saved markers
             self.app.column_markers = []
             self.app.row_markers = []
+            self.show_page_marked_indicator(False)
     
     def reset_markers(self):
         """
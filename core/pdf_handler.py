@@ -5,11 +5,32 @@ This module provides the PDFHandler class, which is responsible for loading PDF
 navigating between pages, and handling zoom operations.
 """
 
+import io
 import json
 import fitz  # PyMuPDF
 from PIL import Image, ImageTk
 import os
-from tkinter import filedialog, messagebox
+from collections import OrderedDict
+from tkinter import PhotoImage, filedialog, messagebox
+
+
+# Maximum total size of the rendered pages kept in memory, in bytes
+_PAGE_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def _ppm_size(ppm):
+    """
+    Read the image size from the header of binary PPM data.
+    
+    Args:
+        ppm: Binary PPM data
+        
+    Returns:
+        tuple: (width, height) in pixels
+    """
+    _, width, height = ppm.split(maxsplit=3)[:3]
+    return int(width), int(height)
+
 
 class PDFHandler:
     """
@@ -27,6 +48,15 @@ class PDFHandler:
             app: The PDFTableExtractorApp instance
         """
         self.app = app
+        self._page_cache = OrderedDict()  # (page index, render zoom) -> binary PPM data
+        self._page_cache_bytes = 0  # Total size of the renders in _page_cache
+        self._display_ppm = None  # Render the current page display was made from
+        self._display_zoom = None  # Zoom factor _display_ppm was rendered at
+        self._hi_res_job = None  # after() id of a pending full quality render
+        self._prefetch_job = None  # after() id of a pending adjacent page render
+        self._matrix = None  # fitz.Matrix for _matrix_zoom, reused between renders
+        self._matrix_zoom = None
+        self._file_stat = None  # (modification time, size) of the PDF file when it was opened
         
     def open_pdf(self):
         """
@@ -38,6 +68,14 @@ class PDFHandler:
         if file_path:
             try:
                 self.app.pdf_document = fitz.open(file_path)
+                stat = os.stat(file_path)
+                self._file_stat = (stat.st_mtime_ns, stat.st_size)
+                self._page_cache.clear()
+                self._page_cache_bytes = 0
+                self.app.table_extractor.clear_words_cache()
+                self.app.text_orientation_corrector.clear_analysis_cache()
+                self._matrix = None
+                self._matrix_zoom = None
                 self.app.total_pages = len(self.app.pdf_document)
                 self.app.current_page = 0
                 self.update_page_display()
@@ -50,6 +88,107 @@ class PDFHandler:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to open PDF: {str(e)}")
     
+    def file_unchanged(self):
+        """
+        Check whether the file of the open PDF is still the one that was opened.
+        
+        Returns:
+            bool: True if the file exists with the modification time and size it had
+                  when opened, so reopening it gives the same document
+        """
+        if not self.app.pdf_document or self._file_stat is None:
+            return False
+        
+        try:
+            stat = os.stat(self.app.pdf_document.name)
+        except (OSError, TypeError, ValueError):
+            return False
+        return (stat.st_mtime_ns, stat.st_size) == self._file_stat
+    
+    def _render_page(self, page_index, zoom):
+        """
+        Render a page of the PDF as PPM image data, reusing recent renders.
+        
+        PPM data can be handed straight to a Tk PhotoImage, so displaying a page
+        needs no intermediate PIL image.
+        
+        Args:
+            page_index: The index of the page to render
+            zoom: The zoom factor to render at
+            
+        Returns:
+            bytes: The rendered page as binary PPM data
+        """
+        key = (page_index, round(zoom, 4))
+        
+        ppm = self._page_cache.get(key)
+        if ppm is not None:
+            self._page_cache.move_to_end(key)
+        else:
+            # Consecutive renders are usually at the same zoom, so keep the matrix
+            if self._matrix_zoom != zoom:
+                self._matrix = fitz.Matrix(zoom, zoom)
+                self._matrix_zoom = zoom
+            
+            page = self.app.pdf_document[page_index]
+            ppm = page.get_pixmap(matrix=self._matrix).tobytes("ppm")
+            
+            self._page_cache[key] = ppm
+            self._page_cache_bytes += len(ppm)
+            
+            # Drop the least recently used renders, always keeping the new one
+            while self._page_cache_bytes > _PAGE_CACHE_BYTES and len(self._page_cache) > 1:
+                _, evicted = self._page_cache.popitem(last=False)
+                self._page_cache_bytes -= len(evicted)
+        
+        return ppm
+    
+    def _page_photo(self, page_index, zoom):
+        """
+        Build the Tk image of a page rendered at a display zoom.
+        
+        When the page image on display has the same size and kind, its pixels are
+        replaced in place rather than allocating a new Tk image. The render used
+        is remembered so zoom previews can be scaled from it.
+        
+        Args:
+            page_index: The index of the page to show
+            zoom: The display zoom factor
+            
+        Returns:
+            The Tk photo image of the page
+        """
+        ppm = self._render_page(page_index, zoom)
+        self._display_ppm = ppm
+        self._display_zoom = zoom
+        
+        photo = self.app.photo
+        
+        # Tk reads the PPM data directly, with no PIL image in between. It must stay
+        # raw binary: Tk 8.6 decodes base64 -data for GIF and PNG but not for PPM.
+        # Tk only ever grows a photo image on reconfiguring, so reuse same-sized ones only
+        if isinstance(photo, PhotoImage) and (photo.width(), photo.height()) == _ppm_size(ppm):
+            photo.configure(data=ppm)
+            return photo
+        return PhotoImage(data=ppm)
+    
+    def _scaled_image(self, ppm, scale):
+        """
+        Scale rendered PPM data by a factor.
+        
+        Args:
+            ppm: Binary PPM data
+            scale: The factor to scale by
+            
+        Returns:
+            PIL.Image.Image: The scaled image
+        """
+        image = Image.open(io.BytesIO(ppm))
+        width, height = image.size
+        return image.resize(
+            (max(1, round(width * scale)), max(1, round(height * scale))), Image.BILINEAR
+        )
+    
     def update_page_display(self):
         """
         Update the canvas to display the current page of the PDF.
@@ -60,71 +199,90 @@ class PDFHandler:
         # Update page label
         self.app.page_label.config(text=f"Page: {self.app.current_page + 1}/{self.app.total_pages}")
         
-        # Get the current page
-        page = self.app.pdf_document[self.app.current_page]
-        
-        # Get the page as an image with the current zoom level
-        zoom = self.app.zoom_factor
-        mat = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=mat)
-        
-        # Convert pixmap to PIL Image
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        # A full render supersedes any pending one from zooming
+        if self._hi_res_job is not None:
+            self.app.canvas.after_cancel(self._hi_res_job)
+            self._hi_res_job = None
         
-        # Convert PIL Image to ImageTk PhotoImage
-        self.app.photo = ImageTk.PhotoImage(img)
+        # Get the current page as an image with the current zoom level
+        photo = self._page_photo(self.app.current_page, self.app.zoom_factor)
         
-        # Delete only the PDF image, not everything
-        self.app.canvas.delete("pdf")
         self.app.canvas.delete("welcome_text")
         
-        # Update canvas scroll region
-        self.app.canvas.config(scrollregion=(0, 0, self.app.photo.width(), self.app.photo.height()))
+        # The PDF image item is created once (underneath any markers) and then reused
+        if not self.app.canvas.find_withtag("pdf"):
+            self.app.canvas.create_image(0, 0, anchor="nw", tags="pdf")
+            self.app.canvas.tag_lower("pdf")
         
-        # Add the new PDF image (underneath any existing markers)
-        self.app.canvas.create_image(0, 0, anchor="nw", image=self.app.photo, tags="pdf")
+        # Show the page and update the canvas scroll region
+        self._replace_page_image(photo)
         
         # Check if there are saved markers for this page and load them
         if self.app.current_page in self.app.page_markers:
             page_marker_data = self.app.page_markers[self.app.current_page]
-            self.app.column_markers = page_marker_data['columns']
-            self.app.row_markers = page_marker_data['rows']
-            
-            # Delete existing page indicator before creating a new one
-            self.app.canvas.delete("page_marked_indicator")
+            self.app.column_markers = page_marker_data['columns'].tolist()
+            self.app.row_markers = page_marker_data['rows'].tolist()
             
             # Show indicator that this page has saved markers
-            self.app.canvas.create_text(
-                10, 10,
-                text="✓ Page Marked",
-                font=("Arial", 10),
-                fill="green",
-                anchor="nw",
-                tags="page_marked_indicator"
-            )
+            self.app.marker_manager.show_page_marked_indicator()
         else:
             # Clear markers when moving to a page without saved markers
             self.app.column_markers = []
             self.app.row_markers = []
+            self.app.marker_manager.show_page_marked_indicator(False)
         
-        # Check if there is manual data for this page
-        if hasattr(self.app, 'manual_input_manager') and \
-        self.app.current_page in self.app.manual_input_manager.all_pages_manual_data:
-            # Delete existing indicator before creating a new one
-            self.app.canvas.delete("page_data_stored_indicator")
-            
-            # Show indicator that this page has stored data
-            self.app.canvas.create_text(
-                self.app.canvas.winfo_width() - 10, 10,
-                text="✓ Data Stored",
-                font=("Arial", 10),
-                fill="#FFD700",  # Gold color
-                anchor="ne",
-                tags="page_data_stored_indicator"
-            )
+        # Show the stored data indicator only if there is manual data for this page
+        if hasattr(self.app, 'manual_input_manager'):
+            manual_input = self.app.manual_input_manager
+            manual_input.show_data_stored_indicator(self.app.current_page in manual_input.all_pages_manual_data)
         
         # Redraw column and row markers
         self.app.marker_manager.redraw_markers()
+        
+        # Render the neighbouring pages while the user looks at this one
+        self._schedule_prefetch()
+    
+    def _schedule_prefetch(self):
+        """
+        Schedule rendering the pages either side of the current one into the page cache.
+        
+        The renders run from Tk's event loop once the display has settled rather
+        than on a worker thread, as a PyMuPDF document must not be used from two
+        threads at once.
+        """
+        if self._prefetch_job is not None:
+            self.app.canvas.after_cancel(self._prefetch_job)
+            self._prefetch_job = None
+        
+        pages = [page for page in (self.app.current_page + 1, self.app.current_page - 1)
+                 if 0 <= page < self.app.total_pages]
+        
+        # Only prefetch as many pages as fit in the cache next to the page on display,
+        # taking neighbouring pages to be the same size, so prefetching never evicts it
+        if self._display_ppm is not None:
+            room = _PAGE_CACHE_BYTES // len(self._display_ppm) - 1
+            pages = pages[:max(room, 0)]
+        if not pages:
+            return
+        self._prefetch_job = self.app.canvas.after(100, self._prefetch_pages, pages)
+    
+    def _prefetch_pages(self, pages):
+        """
+        Render one page into the page cache and schedule the rest.
+        
+        Args:
+            pages: The page indices still to render
+        """
+        self._prefetch_job = None
+        if not self.app.pdf_document or not pages:
+            return
+        
+        if pages[0] < self.app.total_pages:
+            self._render_page(pages[0], self.app.zoom_factor)
+        
+        # One page per callback, so user input is handled between renders
+        if len(pages) > 1:
+            self._prefetch_job = self.app.canvas.after_idle(self._prefetch_pages, pages[1:])
     
     def next_page(self):
         """
@@ -170,67 +328,103 @@ class PDFHandler:
         self.app.current_page -= 1
         self.update_page_display()
     
-    def zoom_in(self):
+    def _preview_zoom(self):
         """
-        Increase the zoom level and refresh the page display while preserving markers.
+        Show the current page at the new zoom level without rasterising it if possible.
+        
+        A render at the new zoom that is still cached is shown straight away.
+        Otherwise rasterising is deferred until zooming pauses, with the last
+        render scaled as a temporary preview meanwhile, so a burst of zoom steps
+        costs a single render.
+        
+        Returns:
+            bool: True if the full page display was rebuilt, False if only the image was swapped
         """
-        # Save current markers
-        current_column_markers = self.app.column_markers.copy()
-        current_row_markers = self.app.row_markers.copy()
+        zoom = self.app.zoom_factor
+        if self._display_ppm is None:
+            self.update_page_display()
+            return True
         
-        # Update zoom factor
-        self.app.zoom_factor *= 1.2
+        if (self.app.current_page, round(zoom, 4)) in self._page_cache:
+            self._replace_page_image(self._page_photo(self.app.current_page, zoom))
+            return False
         
-        # Update the display
-        self.update_page_display()
+        # Cheap preview scaled from the last render
+        preview = self._scaled_image(self._display_ppm, zoom / self._display_zoom)
+        self._replace_page_image(ImageTk.PhotoImage(preview))
         
-        # Restore markers
-        self.app.column_markers = current_column_markers
-        self.app.row_markers = current_row_markers
+        # Render at full quality once zooming has paused
+        if self._hi_res_job is not None:
+            self.app.canvas.after_cancel(self._hi_res_job)
+        self._hi_res_job = self.app.canvas.after(150, self._render_full_quality)
+        return False
+    
+    def _render_full_quality(self):
+        """
+        Replace a zoom preview with a full quality render of the current page.
+        """
+        self._hi_res_job = None
+        if not self.app.pdf_document:
+            return
         
-        # Redraw markers at new zoom level
-        self.app.marker_manager.redraw_markers()
+        self._replace_page_image(self._page_photo(self.app.current_page, self.app.zoom_factor))
+    
+    def _replace_page_image(self, photo):
+        """
+        Swap the page image shown on the canvas, leaving all other items in place.
+        
+        Args:
+            photo: The Tk photo image to show
+        """
+        self.app.photo = photo
+        self.app.canvas.itemconfig("pdf", image=self.app.photo)
+        self.app.canvas.config(scrollregion=(0, 0, self.app.photo.width(), self.app.photo.height()))
+    
+    def zoom_in(self):
+        """
+        Increase the zoom level and refresh the page display while preserving markers.
+        """
+        self._set_zoom(self.app.zoom_factor * 1.2)
 
     def zoom_out(self):
         """
         Decrease the zoom level and refresh the page display while preserving markers.
         """
-        # Save current markers
-        current_column_markers = self.app.column_markers.copy()
-        current_row_markers = self.app.row_markers.copy()
-        
-        # Update zoom factor
-        self.app.zoom_factor /= 1.2
-        if self.app.zoom_factor < 0.1:
-            self.app.zoom_factor = 0.1
-        
-        # Update the display
-        self.update_page_display()
-        
-        # Restore markers
-        self.app.column_markers = current_column_markers
-        self.app.row_markers = current_row_markers
-        
-        # Redraw markers at new zoom level
-        self.app.marker_manager.redraw_markers()
+        self._set_zoom(max(self.app.zoom_factor / 1.2, 0.1))
 
     def reset_zoom(self):
         """
         Reset the zoom level to 100% and refresh the page display while preserving markers.
         """
+        self._set_zoom(1.0)
+    
+    def _set_zoom(self, zoom):
+        """
+        Change the zoom level and refresh the page display while preserving markers.
+        
+        Args:
+            zoom: The new zoom factor
+        """
+        ratio = zoom / self.app.zoom_factor
+        
         # Save current markers
         current_column_markers = self.app.column_markers.copy()
         current_row_markers = self.app.row_markers.copy()
         
-        # Reset zoom factor
-        self.app.zoom_factor = 1.0
+        # Update zoom factor
+        self.app.zoom_factor = zoom
         
         # Update the display
-        self.update_page_display()
+        page_redrawn = self._preview_zoom()
         
         # Restore markers
         self.app.column_markers = current_column_markers
         self.app.row_markers = current_row_markers
         
-        # Redraw markers at new zoom level
-        self.app.marker_manager.redraw_markers()
\ No newline at end of file
+        if page_redrawn:
+            # The full page display drew the page's saved markers, so draw the current ones
+            self.app.marker_manager.redraw_markers()
+        else:
+            # Move the markers already on the canvas to the new zoom level
+            self.app.marker_manager.scale_markers(ratio)
+        self.app.manual_input_manager.invalidate_zoom_cache()
@@ -5,10 +5,201 @@ This module provides the TableExtractor class, which is responsible for extracti
 table data from PDF documents based on row and column markers.
 """
 
-import fitz  # PyMuPDF
+import multiprocessing
 import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import accumulate, zip_longest
 from tkinter import filedialog, messagebox
+
+import numpy as np
+from core.marker_manager import cell_indices
 from gui.dialogs import create_multipage_options_dialog, create_progress_dialog, update_progress
+from gui.main_area import show_table_output
+from utils.exporters import write_csv, write_excel
+
+
+# Marked pages that are not in the words cache are extracted in worker processes
+# when there are at least this many; below that, starting the workers and having
+# each reopen the document costs more than it saves
+_PARALLEL_MIN_PAGES = 50
+
+# Maximum number of pages whose words are kept in memory for re-extraction
+_WORDS_CACHE_SIZE = 32
+
+# The document each worker process has open, so it is only opened once per worker
+_worker_document = None
+_worker_path = None
+
+
+def _index_words(words):
+    """
+    Prepare the words of a page for locating them in tables.
+    
+    The word centers are computed once per page, and the words are also ordered by
+    center x so the words between two column markers can be found by bisection.
+    
+    Args:
+        words: The page words, a list of (x0, y0, x1, y1, text, block, line, word)
+               as returned by page.get_text("words")
+               
+    Returns:
+        dict: The words with their 'centers_x' and 'centers_y' arrays, 'x_order'
+              (word indices sorted by center x) and 'sorted_x' (the sorted centers)
+    """
+    boxes = np.array([word[:4] for word in words], dtype=np.float64).reshape(-1, 4)
+    centers_x = (boxes[:, 0] + boxes[:, 2]) * 0.5
+    centers_y = (boxes[:, 1] + boxes[:, 3]) * 0.5
+    x_order = np.argsort(centers_x, kind='stable')
+    
+    return {
+        'words': words,
+        'centers_x': centers_x,
+        'centers_y': centers_y,
+        'x_order': x_order,
+        'sorted_x': centers_x[x_order],
+    }
+
+
+def _build_table(page_words, column_markers, row_markers, mode):
+    """
+    Build the table for a page from its markers, without updating the UI.
+    
+    Args:
+        page_words: The page words, as prepared by _index_words
+        column_markers: The column marker positions
+        row_markers: The row marker positions
+        mode: The extraction mode ("space" or "newline") used to join text within a cell
+        
+    Returns:
+        list: The extracted table data as a 2D list
+    """
+    # Define cell boundaries - we use ONLY the markers, not page boundaries
+    col_bounds = sorted(column_markers)
+    row_bounds = sorted(row_markers)
+    
+    # Number of columns and rows is the number of cells between markers
+    cols = len(col_bounds) - 1 if len(col_bounds) > 1 else 1
+    rows = len(row_bounds) - 1 if len(row_bounds) > 1 else 1
+    
+    # Initialize an empty grid for the table
+    table = [['' for _ in range(cols)] for _ in range(rows)]
+    
+    # Assign words to appropriate cells. Words from the same line of the page are
+    # joined with spaces, like the text of a span; separate lines use the mode's separator
+    separator = " " if mode == "space" else "\n"
+    cell_lines = [[None] * cols for _ in range(rows)]
+    for row_idx, col_idx, line, text in _locate_words(page_words, col_bounds, row_bounds):
+        if table[row_idx][col_idx]:
+            joiner = " " if cell_lines[row_idx][col_idx] == line else separator
+            table[row_idx][col_idx] += joiner + text
+        else:
+            table[row_idx][col_idx] = text
+        cell_lines[row_idx][col_idx] = line
+    
+    return table
+
+
+def _locate_words(page_words, col_bounds, row_bounds):
+    """
+    Find the table cell of every word on a page.
+    
+    Only the words between the outermost column markers are considered, and their
+    cells are found in one vectorised pass rather than by scanning the markers
+    for each word.
+    
+    Args:
+        page_words: The page words, as prepared by _index_words
+        col_bounds: The sorted column marker positions
+        row_bounds: The sorted row marker positions
+        
+    Returns:
+        list: (row index, column index, (block, line), text) for each word inside
+              the table, in page order
+    """
+    # Without at least two markers on each axis there are no cells
+    if len(col_bounds) < 2 or len(row_bounds) < 2:
+        return []
+    
+    words = page_words['words']
+    
+    # Words centered left of the first column marker or at/after the last one are
+    # outside the table; keep the rest in page order
+    lo, hi = np.searchsorted(page_words['sorted_x'], [col_bounds[0], col_bounds[-1]])
+    candidates = np.sort(page_words['x_order'][lo:hi])
+    
+    # Find which cell each word belongs to (use the center point).
+    # Text outside the outermost markers gets -1, so this also drops text outside the table
+    col_indices = cell_indices(col_bounds, page_words['centers_x'][candidates])
+    row_indices = cell_indices(row_bounds, page_words['centers_y'][candidates])
+    inside = np.flatnonzero((col_indices >= 0) & (row_indices >= 0))
+    
+    return [
+        (row_idx, col_idx, (words[i][5], words[i][6]), words[i][4])
+        for i, row_idx, col_idx in zip(candidates[inside].tolist(),
+                                       row_indices[inside].tolist(),
+                                       col_indices[inside].tolist())
+    ]
+
+
+def _transpose(table):
+    """
+    Swap the rows and columns of a table.
+    
+    Rows shorter than the widest row are filled with empty cells while transposing,
+    so no padded copy of the table is built first.
+    
+    Args:
+        table: The table data as a 2D list
+        
+    Returns:
+        list: The transposed table data as a 2D list
+    """
+    return [list(column) for column in zip_longest(*table, fillvalue='')]
+
+
+def _extract_page(get_words, page_index, column_markers, row_markers, mode):
+    """
+    Build the table for one marked page, reporting rather than raising errors.
+    
+    Args:
+        get_words: Function returning the words of a page given its index, as
+                   prepared by _index_words
+        page_index: The index of the page
+        column_markers: The column marker positions
+        row_markers: The row marker positions
+        mode: The extraction mode ("space" or "newline")
+        
+    Returns:
+        list: The extracted table data as a 2D list, or None if extraction failed
+    """
+    try:
+        return _build_table(get_words(page_index), column_markers, row_markers, mode)
+    except Exception as e:
+        print(f"Error extracting table from page {page_index + 1}: {str(e)}")
+        return None
+
+
+def _extract_page_worker(task):
+    """
+    Extract one marked page in a worker process.
+    
+    Args:
+        task: Tuple of (pdf path, page index, column markers, row markers, mode)
+        
+    Returns:
+        list: The extracted table data as a 2D list, or None if extraction failed
+    """
+    global _worker_document, _worker_path
+    
+    pdf_path, page_index, column_markers, row_markers, mode = task
+    if _worker_path != pdf_path:
+        import fitz  # PyMuPDF
+        _worker_document = fitz.open(pdf_path)
+        _worker_path = pdf_path
+    
+    return _extract_page(lambda index: _index_words(_worker_document[index].get_text("words")),
+                         page_index, column_markers, row_markers, mode)
 
 class TableExtractor:
     """
@@ -26,6 +217,40 @@ class TableExtractor:
             app: The PDFTableExtractorApp instance
         """
         self.app = app
+        self._words_cache = OrderedDict()  # (document id, page index) -> indexed page words
+    
+    def clear_words_cache(self):
+        """
+        Forget the cached page words, for when another document is opened.
+        """
+        self._words_cache.clear()
+    
+    def _get_page_words(self, page_index):
+        """
+        Get the words of a page of the current document, reusing recent extractions.
+        
+        Re-extracting a page after adjusting its markers then skips reading and
+        indexing its text again.
+        
+        Args:
+            page_index: The index of the page
+            
+        Returns:
+            dict: The page words, as prepared by _index_words
+        """
+        key = (id(self.app.pdf_document), page_index)
+        
+        words = self._words_cache.get(key)
+        if words is not None:
+            self._words_cache.move_to_end(key)
+        else:
+            words = _index_words(self.app.pdf_document[page_index].get_text("words"))
+            
+            self._words_cache[key] = words
+            if len(self._words_cache) > _WORDS_CACHE_SIZE:
+                self._words_cache.popitem(last=False)
+        
+        return words
     
     def extract_table(self):
         """
@@ -39,86 +264,26 @@ class TableExtractor:
         self._show_extraction_mode_dialog()
         
         try:
-            # Get the current page
-            page = self.app.pdf_document[self.app.current_page]
-            
             # Use the markers to define the table boundaries
-            min_x = min(self.app.column_markers) if self.app.column_markers else 0
-            max_x = max(self.app.column_markers) if self.app.column_markers else page.rect.width
-            min_y = min(self.app.row_markers) if self.app.row_markers else 0
-            max_y = max(self.app.row_markers) if self.app.row_markers else page.rect.height
-            
-            # Create a grid based on row and column markers
-            # Sort the markers to ensure correct order
-            sorted_col_markers = sorted(self.app.column_markers)
-            sorted_row_markers = sorted(self.app.row_markers)
-            
-            # Define cell boundaries - we use ONLY the markers, not min/max or page boundaries
-            col_bounds = sorted_col_markers  # We don't add min_x or max_x
-            row_bounds = sorted_row_markers  # We don't add min_y or max_y
-            
-            # Number of columns and rows is the number of cells between markers
-            cols = len(col_bounds) - 1 if len(col_bounds) > 1 else 1
-            rows = len(row_bounds) - 1 if len(row_bounds) > 1 else 1
-            
-            # Initialize an empty grid for the table
-            table = [['' for _ in range(cols)] for _ in range(rows)]
-            
-            # Get text from the page
-            text_page = page.get_text("dict")
+            min_x = min(self.app.column_markers)
+            max_x = max(self.app.column_markers)
+            min_y = min(self.app.row_markers)
+            max_y = max(self.app.row_markers)
             
             # Draw the table outline for visual reference
             self.app.marker_manager.highlight_table_area(min_x, min_y, max_x, max_y)
             
-            # Assign text blocks to appropriate cells
-            for block in text_page["blocks"]:
-                if block["type"] == 0:  # Type 0 is text
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            # Get text and its bounding box
-                            text = span["text"]
-                            text_rect = fitz.Rect(span["bbox"])
-                            
-                            # Find which cell this text belongs to (use the center point)
-                            center_x = text_rect.x0 + (text_rect.x1 - text_rect.x0) / 2
-                            center_y = text_rect.y0 + (text_rect.y1 - text_rect.y0) / 2
-                            
-                            # Check if the text is within our table boundaries
-                            if not (min_x <= center_x <= max_x and min_y <= center_y <= max_y):
-                                continue
-                            
-                            # Find column index
-                            col_idx = -1
-                            for i in range(len(col_bounds) - 1):
-                                if col_bounds[i] <= center_x < col_bounds[i + 1]:
-                                    col_idx = i
-                                    break
-                            
-                            # Find row index
-                            row_idx = -1
-                            for i in range(len(row_bounds) - 1):
-                                if row_bounds[i] <= center_y < row_bounds[i + 1]:
-                                    row_idx = i
-                                    break
-                            
-                            # Add text to the appropriate cell
-                            if col_idx >= 0 and row_idx >= 0 and col_idx < cols and row_idx < rows:
-                                if table[row_idx][col_idx]:
-                                    table[row_idx][col_idx] += "\n" + text  # Use newline instead of space
-                                else:
-                                    table[row_idx][col_idx] = text
+            # Text within a cell is joined with newlines here, whichever mode was chosen
+            words = self._get_page_words(self.app.current_page)
+            table = _build_table(words, self.app.column_markers, self.app.row_markers, "newline")
+            rows = len(table)
+            cols = len(table[0])
             
             # Store the extracted table data for later use (CSV or Excel export)
             self.app.table_data = table
             
-            # Format table as CSV for display
-            csv_data = ""
-            for row in table:
-                csv_data += ",".join(f'"{cell}"' if cell else "" for cell in row) + "\n"
-            
-            # Display in the text output area
-            self.app.text_output.delete(1.0, "end")
-            self.app.text_output.insert("end", csv_data)
+            # Display the table as CSV in the text output area
+            show_table_output(self.app, table)
             
             self.app.status_label.config(text=f"Table extracted successfully: {rows}x{cols} grid")
             
@@ -129,12 +294,7 @@ class TableExtractor:
                     self._correct_text_orientation(table)
                     
                     # Update display with corrected data
-                    csv_data = ""
-                    for row in self.app.table_data:
-                        csv_data += ",".join(f'"{cell}"' if cell else "" for cell in row) + "\n"
-                    
-                    self.app.text_output.delete(1.0, "end")
-                    self.app.text_output.insert("end", csv_data)
+                    show_table_output(self.app, self.app.table_data)
                     self.app.status_label.config(text=f"Table extracted with orientation correction: {rows}x{cols} grid")
             
         except Exception as e:
@@ -150,6 +310,11 @@ class TableExtractor:
         Returns:
             bool: True if orientation issues are detected
         """
+        # Vertical text is only ever spread over several lines, so a table without
+        # any line breaks (as with the "space" mode) has nothing to detect
+        if not any('\n' in cell for row in table for cell in row if cell):
+            return False
+        
         # Flatten the table data for easier analysis
         all_text = []
         for row in table:
@@ -201,12 +366,8 @@ class TableExtractor:
                     # For the specific pattern in your examples:
                     # 1. Reverse each segment (read right-to-left)
                     # 2. Reverse the order of segments (read bottom-to-top)
-                    corrected_segments = []
-                    for segment in reversed(lines):
-                        corrected_segments.append(segment[::-1])
-                    
-                    # Join all segments
-                    corrected_text = ''.join(corrected_segments)
+                    # Together these reverse the joined segments, done in one slice
+                    corrected_text = ''.join(lines)[::-1]
                     
                     # Clean up any special characters
                     corrected_text = corrected_text.replace('\\n', '')
@@ -227,12 +388,7 @@ class TableExtractor:
             self._correct_text_orientation(self.app.table_data)
             
             # Update display with corrected data
-            csv_data = ""
-            for row in self.app.table_data:
-                csv_data += ",".join(f'"{cell}"' if cell else "" for cell in row) + "\n"
-            
-            self.app.text_output.delete(1.0, "end")
-            self.app.text_output.insert("end", csv_data)
+            show_table_output(self.app, self.app.table_data)
             self.app.status_label.config(text="Forced text orientation correction applied")
             
         except Exception as e:
@@ -247,29 +403,22 @@ class TableExtractor:
             return
             
         try:
-            # Get the dimensions of the current table
+            # Get the dimensions of the current table (it is rectangular)
             rows = len(self.app.table_data)
-            cols = max(len(row) for row in self.app.table_data) if self.app.table_data else 0
+            cols = len(self.app.table_data[0])
             
             if rows == 0 or cols == 0:
                 messagebox.showwarning("Warning", "Cannot transpose an empty table.")
                 return
             
-            # Create a new transposed table (ensure all rows have the same length)
-            padded_table = [row + [''] * (cols - len(row)) for row in self.app.table_data]
-            transposed = list(map(list, zip(*padded_table)))
+            # Create a new transposed table, filling in the cells missing from short rows
+            transposed = _transpose(self.app.table_data)
             
             # Update the table data
             self.app.table_data = transposed
             
-            # Format table as CSV for display
-            csv_data = ""
-            for row in transposed:
-                csv_data += ",".join(f'"{cell}"' if cell else "" for cell in row) + "\n"
-            
-            # Display in the text output area
-            self.app.text_output.delete(1.0, "end")
-            self.app.text_output.insert("end", csv_data)
+            # Display the table as CSV in the text output area
+            show_table_output(self.app, transposed)
             
             self.app.status_label.config(text=f"Table transposed: {cols}x{rows} grid")
         except Exception as e:
@@ -294,9 +443,8 @@ class TableExtractor:
             
             if file_path:
                 try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        for row in self.app.table_data:
-                            f.write(",".join(f'"{cell}"' if cell else "" for cell in row) + "\n")
+                    with open(file_path, 'w', encoding='utf-8', newline='') as f:
+                        write_csv(f, self.app.table_data)
                     self.app.status_label.config(text=f"Saved to CSV: {os.path.basename(file_path)}")
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to save CSV file: {str(e)}")
@@ -309,28 +457,10 @@ class TableExtractor:
             
             if file_path:
                 try:
-                    # Check if pandas and openpyxl are available
-                    try:
-                        import pandas as pd
-                        import openpyxl
-                    except ImportError as e:
-                        if "pandas" in str(e):
-                            messagebox.showerror("Error", "The pandas package is required for Excel export. \n\nPlease run: pip install pandas openpyxl")
-                            return
-                        elif "openpyxl" in str(e):
-                            messagebox.showerror("Error", "The openpyxl package is required for Excel export. \n\nPlease run: pip install openpyxl")
-                            return
-                        else:
-                            raise e
-                    
-                    # Convert table data to pandas DataFrame
-                    df = pd.DataFrame(self.app.table_data)
-                    
-                    # Write DataFrame to Excel
-                    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                        df.to_excel(writer, sheet_name='Extracted Table', index=False, header=False)
-                    
+                    write_excel(file_path, self.app.table_data)
                     self.app.status_label.config(text=f"Saved to Excel: {os.path.basename(file_path)}")
+                except ImportError:
+                    messagebox.showerror("Error", "The openpyxl package is required for Excel export. \n\nPlease run: pip install openpyxl")
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to save Excel file: {str(e)}")
     
@@ -358,11 +488,8 @@ class TableExtractor:
         merge_mode = options['merge_mode']
         do_transpose = options['transpose']
         
-        # Remember current page and markers to restore later
-        original_page = self.app.current_page
-        original_column_markers = self.app.column_markers.copy()
-        original_row_markers = self.app.row_markers.copy()
-        
+        # Pages are read with their saved markers and never displayed, so the current
+        # page and its markers are left untouched
         try:
             # Create progress window
             progress_window, progress_label, progress_bar = create_progress_dialog(
@@ -371,41 +498,21 @@ class TableExtractor:
                 "Extracting tables from marked pages..."
             )
             
-            # Calculate total pages
-            total_pages = len(self.app.page_markers)
-            
-            progress_window.update()
-            
             # Extract tables from each marked page
-            all_tables = []
             marked_pages = sorted(self.app.page_markers.keys())
-            
-            for i, page_idx in enumerate(marked_pages):
-                # Update progress
-                progress_ratio = (i + 1) / total_pages
-                update_progress(
-                    progress_bar, 
-                    progress_label,
-                    f"Extracting page {page_idx + 1} ({i + 1}/{len(marked_pages)})...",
-                    progress_ratio
-                )
-                
-                # Load this page's markers
-                page_marker_data = self.app.page_markers[page_idx]
-                self.app.column_markers = page_marker_data['columns']
-                self.app.row_markers = page_marker_data['rows']
-                
-                # Navigate to this page
-                self.app.current_page = page_idx
-                self.app.pdf_handler.update_page_display()
-                
-                # Extract table from this page (already uses the selected extraction mode)
-                page_table = self._extract_table_data(page_idx)
-                if page_table:
-                    all_tables.append(page_table)
-            
-            # Close progress window
-            progress_window.destroy()
+            tasks = [
+                (page_idx, self.app.page_markers[page_idx]['columns'],
+                 self.app.page_markers[page_idx]['rows'], self.extraction_mode)
+                for page_idx in marked_pages
+            ]
+            try:
+                page_tables = self._extract_pages(tasks, progress_bar, progress_label)
+            finally:
+                # Close progress window, also when a worker process failed
+                progress_window.destroy()
+            
+            # Keep the tables in page order, skipping pages that failed
+            all_tables = [page_tables[page_idx] for page_idx in marked_pages if page_tables[page_idx]]
             
             if not all_tables:
                 messagebox.showwarning("Warning", "No tables could be extracted from the marked pages.")
@@ -419,122 +526,90 @@ class TableExtractor:
             
             # Transpose if requested
             if do_transpose:
-                # Create a padded table to ensure all rows have the same length
-                max_cols = max(len(row) for row in merged_table)
-                padded_table = [row + [''] * (max_cols - len(row)) for row in merged_table]
-                merged_table = list(map(list, zip(*padded_table)))
+                merged_table = _transpose(merged_table)
             
             # Set as the current table data
             self.app.table_data = merged_table
             
-            # Format table as CSV for display
-            csv_data = ""
-            for row in merged_table:
-                csv_data += ",".join(f'"{cell}"' if cell else "" for cell in row) + "\n"
-            
-            # Display in the text output area
-            self.app.text_output.delete(1.0, "end")
-            self.app.text_output.insert("end", csv_data)
+            # Display the table as CSV in the text output area
+            show_table_output(self.app, merged_table)
             
             rows = len(merged_table)
-            cols = max(len(row) for row in merged_table) if merged_table else 0
+            cols = len(merged_table[0]) if merged_table else 0
             page_range = ", ".join(str(p + 1) for p in marked_pages)
             
             self.app.status_label.config(text=f"Extracted {rows}x{cols} table from pages: {page_range}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to extract from marked pages: {str(e)}")
-        finally:
-            # Restore original page and markers
-            self.app.current_page = original_page
-            self.app.column_markers = original_column_markers
-            self.app.row_markers = original_row_markers
-            self.app.pdf_handler.update_page_display()
-    
-    def _extract_table_data(self, page_index):
+    
+    def _extract_pages(self, tasks, progress_bar, progress_label):
         """
-        Extract table data from a specific page without updating the UI.
+        Extract the tables of marked pages, reporting progress as pages complete.
+        
+        Pages whose words are already cached are extracted here. The rest are
+        extracted in worker processes when there are enough of them to be worth
+        starting workers, which reopen the file and read every page again. Workers
+        are only used while the file on disk is still the one that was opened,
+        and are spawned rather than forked so the Tk process is never copied.
         
         Args:
-            page_index: The index of the page to extract from
+            tasks: List of (page index, column markers, row markers, mode) tuples
+            progress_bar: The progress bar of the progress dialog
+            progress_label: The label of the progress dialog
             
         Returns:
-            list: The extracted table data as a 2D list, or None if extraction failed
+            dict: The extracted table of each page (None where extraction failed)
         """
-        try:
-            # Get the page
-            page = self.app.pdf_document[page_index]
+        total_pages = len(tasks)
+        page_tables = {}
+        
+        document_id = id(self.app.pdf_document)
+        local_tasks = [task for task in tasks if (document_id, task[0]) in self._words_cache]
+        worker_tasks = [task for task in tasks if (document_id, task[0]) not in self._words_cache]
+        
+        pdf_path = self.app.pdf_document.name
+        if len(worker_tasks) < _PARALLEL_MIN_PAGES or not self.app.pdf_handler.file_unchanged():
+            local_tasks = tasks
+            worker_tasks = []
+        
+        for page_idx, column_markers, row_markers, mode in local_tasks:
+            # Update progress
+            update_progress(
+                progress_bar, 
+                progress_label,
+                f"Extracting page {page_idx + 1} ({len(page_tables) + 1}/{total_pages})...",
+                (len(page_tables) + 1) / total_pages
+            )
             
-            # Use the markers to define the table boundaries
-            min_x = min(self.app.column_markers) if self.app.column_markers else 0
-            max_x = max(self.app.column_markers) if self.app.column_markers else page.rect.width
-            min_y = min(self.app.row_markers) if self.app.row_markers else 0
-            max_y = max(self.app.row_markers) if self.app.row_markers else page.rect.height
-            
-            # Create a grid based on row and column markers
-            sorted_col_markers = sorted(self.app.column_markers)
-            sorted_row_markers = sorted(self.app.row_markers)
-            
-            # Define cell boundaries
-            col_bounds = sorted_col_markers
-            row_bounds = sorted_row_markers
-            
-            # Number of columns and rows
-            cols = len(col_bounds) - 1 if len(col_bounds) > 1 else 1
-            rows = len(row_bounds) - 1 if len(row_bounds) > 1 else 1
-            
-            # Initialize an empty grid for the table
-            table = [['' for _ in range(cols)] for _ in range(rows)]
-            
-            # Get text from the page
-            text_page = page.get_text("dict")
-            
-            # Assign text blocks to appropriate cells
-            for block in text_page["blocks"]:
-                if block["type"] == 0:  # Type 0 is text
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            # Get text and its bounding box
-                            text = span["text"]
-                            text_rect = fitz.Rect(span["bbox"])
-                            
-                            # Find which cell this text belongs to (use the center point)
-                            center_x = text_rect.x0 + (text_rect.x1 - text_rect.x0) / 2
-                            center_y = text_rect.y0 + (text_rect.y1 - text_rect.y0) / 2
-                            
-                            # Check if the text is within our table boundaries
-                            if not (min_x <= center_x <= max_x and min_y <= center_y <= max_y):
-                                continue
-                            
-                            # Find column index
-                            col_idx = -1
-                            for i in range(len(col_bounds) - 1):
-                                if col_bounds[i] <= center_x < col_bounds[i + 1]:
-                                    col_idx = i
-                                    break
-                            
-                            # Find row index
-                            row_idx = -1
-                            for i in range(len(row_bounds) - 1):
-                                if row_bounds[i] <= center_y < row_bounds[i + 1]:
-                                    row_idx = i
-                                    break
-                            
-                            # Add text to the appropriate cell
-                            if col_idx >= 0 and row_idx >= 0 and col_idx < cols and row_idx < rows:
-                                if table[row_idx][col_idx]:
-                                    if self.extraction_mode == "space":
-                                        table[row_idx][col_idx] += " " + text
-                                    elif self.extraction_mode == "newline":
-                                        table[row_idx][col_idx] += "\n" + text
-                                else:
-                                    table[row_idx][col_idx] = text
-            
-            return table
-        except Exception as e:
-            print(f"Error extracting table from page {page_index + 1}: {str(e)}")
-            return None
-
+            # Extract table from this page with its saved markers and the selected mode
+            page_tables[page_idx] = _extract_page(self._get_page_words, page_idx,
+                                                  column_markers, row_markers, mode)
+        
+        if worker_tasks:
+            with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 4),
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = {
+                    executor.submit(_extract_page_worker, (pdf_path,) + task): task[0]
+                    for task in worker_tasks
+                }
+                for future in as_completed(futures):
+                    page_idx = futures[future]
+                    try:
+                        page_tables[page_idx] = future.result()
+                    except Exception as e:
+                        # A failed worker loses only its page, as in _extract_page
+                        print(f"Error extracting table from page {page_idx + 1}: {str(e)}")
+                        page_tables[page_idx] = None
+                    update_progress(
+                        progress_bar,
+                        progress_label,
+                        f"Extracted page {page_idx + 1} ({len(page_tables)}/{total_pages})...",
+                        len(page_tables) / total_pages
+                    )
+        
+        return page_tables
+    
     def _show_extraction_mode_dialog(self):
         """
         Show a dialog to select the extraction mode for text.
@@ -620,18 +695,27 @@ class TableExtractor:
         """
         Merge multiple tables by stacking them vertically.
         
+        Rows of tables narrower than the widest one are padded with empty cells,
+        so the merged table stays rectangular.
+        
         Args:
-            tables: A list of table data (each table is a 2D list)
+            tables: A list of rectangular table data (each table is a 2D list)
             
         Returns:
             list: The merged table data
         """
         if not tables:
             return []
-            
+        
+        width = max((len(table[0]) for table in tables if table), default=0)
+        
         merged = []
         for table in tables:
-            merged.extend(table)
+            if table and len(table[0]) < width:
+                padding = [''] * (width - len(table[0]))
+                merged.extend(row + padding for row in table)
+            else:
+                merged.extend(table)
         return merged
     
     def merge_tables_horizontally(self, tables):
@@ -639,7 +723,7 @@ class TableExtractor:
         Merge multiple tables by appending them horizontally.
         
         Args:
-            tables: A list of table data (each table is a 2D list)
+            tables: A list of rectangular table data (each table is a 2D list)
             
         Returns:
             list: The merged table data
@@ -650,23 +734,16 @@ class TableExtractor:
         # Find the maximum row count across all tables
         max_rows = max(len(table) for table in tables)
         
-        # Pad tables to have the same number of rows
-        padded_tables = []
-        for table in tables:
-            # Ensure all rows in the table have the same length
-            cols = max(len(row) for row in table) if table else 0
-            padded_table = [row + [''] * (cols - len(row)) for row in table]
-            
-            # Pad the table to have max_rows rows
-            padded_table.extend([[''] * cols for _ in range(max_rows - len(padded_table))])
-            padded_tables.append(padded_table)
+        # Each table takes as many columns as its rows are long
+        cols_per_table = [len(table[0]) if table else 0 for table in tables]
         
-        # Merge the padded tables horizontally
-        merged = []
-        for row_idx in range(max_rows):
-            merged_row = []
-            for table in padded_tables:
-                merged_row.extend(table[row_idx])
-            merged.append(merged_row)
+        # Column offset of each table in the merged rows, followed by the total width
+        offsets = list(accumulate(cols_per_table, initial=0))
+        
+        # Allocate the merged table padded with empty cells, then copy each row into place
+        merged = [[''] * offsets[-1] for _ in range(max_rows)]
+        for table, table_offset in zip(tables, offsets):
+            for row_idx, row in enumerate(table):
+                merged[row_idx][table_offset:table_offset + len(row)] = row
         
         return merged
\ No newline at end of file
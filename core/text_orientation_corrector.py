@@ -6,7 +6,22 @@ detecting and correcting the orientation of text extracted from PDF documents.
 """
 
 import re
+from itertools import chain
 from tkinter import messagebox
+from gui.main_area import show_table_output
+
+# Patterns used to recognise vertically extracted text, compiled once
+_SINGLE_CHAR_RE = re.compile(r'(?:\s[A-Za-z]\s){3,}')  # 3+ single letters with spaces
+_NEWLINE_IN_WORD_RE = re.compile(r'[A-Za-z]\n[A-Za-z]')  # Line break mid-word
+_ALT_CHAR_RE = re.compile(r'(?:[A-Za-z] ){2,}[A-Za-z]')  # Letters separated by spaces
+
+# Maximum number of table analyses remembered
+_ANALYSIS_CACHE_SIZE = 8
+
+# Common English words written backward, as found in reversed text (e.g. "elbaT" for "Table")
+_REVERSED_WORDS_RE = re.compile('|'.join(
+    map(re.escape, ['eht', 'dna', 'rof', 'era', 'elbaT', 'egaP', 'txeT', 'ataD'])
+))
 
 class TextOrientationCorrector:
     """
@@ -26,6 +41,13 @@ class TextOrientationCorrector:
         self.app = app
         self.original_table_data = None
         self.corrected_table_data = None
+        self._analysis_cache = {}  # (document id, page, table contents) -> analysis result
+    
+    def clear_analysis_cache(self):
+        """
+        Forget remembered orientation analyses, for when another document is opened.
+        """
+        self._analysis_cache.clear()
         
     def correct_text_orientation(self):
         """
@@ -39,11 +61,21 @@ class TextOrientationCorrector:
             return
             
         try:
-            # Backup original data
-            self.original_table_data = [row[:] for row in self.app.table_data]
+            # Backup original data as an immutable snapshot, which is also hashable
+            self.original_table_data = tuple(map(tuple, self.app.table_data))
+            
+            # Analyze the extracted text to determine if correction is needed, reusing
+            # the result of an earlier analysis of the same table on the same page
+            key = (id(self.app.pdf_document), self.app.current_page, self.original_table_data)
+            analysis = self._analysis_cache.get(key)
+            if analysis is None:
+                analysis = self._analyze_text_orientation()
+                
+                if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+                    del self._analysis_cache[next(iter(self._analysis_cache))]
+                self._analysis_cache[key] = analysis
             
-            # Analyze the extracted text to determine if correction is needed
-            needs_correction, correction_type = self._analyze_text_orientation()
+            needs_correction, correction_type = analysis
             
             if not needs_correction:
                 messagebox.showinfo("Information", "No text orientation issues detected.")
@@ -58,13 +90,7 @@ class TextOrientationCorrector:
                 self._correct_flipped_text()
             
             # Display the corrected data
-            csv_data = ""
-            for row in self.app.table_data:
-                csv_data += ",".join(f'"{cell}"' if cell else "" for cell in row) + "\n"
-            
-            # Display in the text output area
-            self.app.text_output.delete(1.0, "end")
-            self.app.text_output.insert("end", csv_data)
+            show_table_output(self.app, self.app.table_data)
             
             self.app.status_label.config(text=f"Text orientation corrected")
             
@@ -81,49 +107,44 @@ class TextOrientationCorrector:
             tuple: (needs_correction, correction_type) where correction_type can be 
                   "vertical", "rtl", "flipped", or None
         """
-        # Flatten the table data for easier analysis
-        all_text = ' '.join([''.join([cell for cell in row if cell]) for row in self.app.table_data])
+        # Flatten the table data for easier analysis (cells of a row run together,
+        # rows are separated by spaces)
+        all_text = ' '.join(''.join(filter(None, row)) for row in self.app.table_data)
         
         # Check if text is too short to analyze
         if len(all_text) < 20:
             return False, None
+        
+        # Vertical text flagged in the PDF itself is enough to decide on its own, so
+        # check it first and skip the text heuristics when it is found
+        pdf_needs_correction, pdf_correction_type = self.detect_text_orientation_from_pdf()
+        if pdf_needs_correction and pdf_correction_type == "vertical":
+            return True, "vertical"
             
         # Count patterns that indicate vertical text
         vertical_indicators = 0
         
         # Check for characteristic patterns in vertical text extraction
         # 1. Single characters separated by spaces (common in vertical extraction)
-        single_char_pattern = re.compile(r'(?:\s[a-zA-Z]\s){3,}')  # 3+ single letters with spaces
-        single_char_matches = single_char_pattern.findall(all_text)
+        single_char_matches = _SINGLE_CHAR_RE.findall(all_text)
         vertical_indicators += len(single_char_matches) * 2
         
         # 2. Words with reversed character order (e.g., "elbaT" instead of "Table")
-        # Find common English words backward (simplified approach)
-        common_reversed = ['eht', 'dna', 'rof', 'era', 'elbaT', 'egaP', 'txeT', 'ataD']
-        for word in common_reversed:
-            reversed_count = all_text.count(word)
-            vertical_indicators += reversed_count * 3
+        # Find common English words backward (simplified approach), all in one scan
+        vertical_indicators += len(_REVERSED_WORDS_RE.findall(all_text)) * 3
             
         # 3. Check for unusual character frequency patterns seen in vertical text
         # In English, 'e' is most common, but in vertical scan of normal text, other patterns emerge
-        char_count = {}
-        for char in all_text.lower():
-            if char.isalpha():
-                char_count[char] = char_count.get(char, 0) + 1
+        # Only the counts of 'n' and 'e' are compared, so count just those two
+        lowered = all_text.lower()
                 
-        if char_count.get('n', 0) > char_count.get('e', 0) * 1.5:
+        if lowered.count('n') > lowered.count('e') * 1.5:
             vertical_indicators += 5
         
         # 4. Check for new line characters mid-word (common in vertical extraction)
-        newline_in_word = re.compile(r'[a-zA-Z]\n[a-zA-Z]')
-        newline_matches = newline_in_word.findall(all_text)
+        newline_matches = _NEWLINE_IN_WORD_RE.findall(all_text)
         vertical_indicators += len(newline_matches)
         
-        # 5. Try direct detection from PDF if available
-        pdf_needs_correction, pdf_correction_type = self.detect_text_orientation_from_pdf()
-        if pdf_needs_correction and pdf_correction_type == "vertical":
-            vertical_indicators += 10
-        
         # Determine if correction is needed and what type
         if vertical_indicators >= 5:
             return True, "vertical"
@@ -135,8 +156,11 @@ class TextOrientationCorrector:
         Correct vertically extracted text by rearranging characters.
         This handles cases where text is printed horizontally but extracted vertically.
         """
+        # Local alias for the per-cell pattern check
+        alt_char_match = _ALT_CHAR_RE.match
+        
         # For each cell, detect and correct vertical text
-        for row_idx, row in enumerate(self.app.table_data):
+        for row in self.app.table_data:
             for col_idx, cell in enumerate(row):
                 if not cell:
                     continue
@@ -145,32 +169,31 @@ class TextOrientationCorrector:
                 if len(cell) < 3 or cell.isdigit():
                     continue
                     
-                # Check if cell contains vertical text (multiple lines with 1-2 characters per line)
-                lines = cell.split('\n')
-                is_vertical = False
-                
-                # Check if most lines are 1-2 characters
-                short_lines = [line for line in lines if len(line.strip()) <= 2 and len(line.strip()) > 0]
-                
-                if len(lines) >= 3 and len(short_lines) > len(lines) * 0.6:
-                    is_vertical = True
+                # Vertical text spans at least 3 lines, so only such cells are split
+                newlines = cell.count('\n')
                 
-                if is_vertical:
-                    # Reconstruct the text by reading from bottom to top (reverse the lines)
-                    # and join characters into words
-                    corrected_text = ''.join(line.strip() for line in reversed(lines) if line.strip())
+                if newlines >= 2:
+                    # Check if cell contains vertical text (most lines are 1-2 characters)
+                    lines = cell.split('\n')
+                    short_lines = sum(1 for line in lines if 0 < len(line.strip()) <= 2)
                     
-                    # If the result looks meaningful (heuristic check)
-                    if len(corrected_text) >= 3:
-                        self.app.table_data[row_idx][col_idx] = corrected_text
+                    if short_lines > len(lines) * 0.6:
+                        # Reconstruct the text by reading from bottom to top (reverse the lines)
+                        # and join characters into words
+                        stripped = [line.strip() for line in lines[::-1]]
+                        corrected_text = ''.join([line for line in stripped if line])
+                        
+                        # If the result looks meaningful (heuristic check)
+                        if len(corrected_text) >= 3:
+                            row[col_idx] = corrected_text
                         
                 # Alternative approach for non-newline vertical text
-                elif '\n' not in cell and len(cell) >= 3:
+                elif newlines == 0:
                     # Check for alternating character-space pattern (e.g., "e k o t S")
-                    if re.match(r'([a-zA-Z] ){2,}[a-zA-Z]', cell):
+                    if alt_char_match(cell):
                         # Remove spaces and reverse (as vertical text is often read bottom-to-top)
-                        corrected_text = ''.join(reversed(cell.replace(' ', '')))
-                        self.app.table_data[row_idx][col_idx] = corrected_text
+                        corrected_text = cell.replace(' ', '')[::-1]
+                        row[col_idx] = corrected_text
         
         self.corrected_table_data = self.app.table_data
                         
@@ -179,13 +202,13 @@ class TextOrientationCorrector:
         Correct right-to-left text by reversing character order.
         """
         # For each cell, reverse the text to correct RTL issues
-        for row_idx, row in enumerate(self.app.table_data):
+        for row in self.app.table_data:
             for col_idx, cell in enumerate(row):
                 if not cell or len(cell) < 2:
                     continue
                     
                 # Reverse the text
-                self.app.table_data[row_idx][col_idx] = cell[::-1]
+                row[col_idx] = cell[::-1]
         
         self.corrected_table_data = self.app.table_data
     
@@ -194,7 +217,7 @@ class TextOrientationCorrector:
         Correct upside-down text by rotating 180 degrees.
         """
         # For each cell, flip the text upside-down
-        for row_idx, row in enumerate(self.app.table_data):
+        for row in self.app.table_data:
             for col_idx, cell in enumerate(row):
                 if not cell or len(cell) < 2:
                     continue
@@ -202,7 +225,7 @@ class TextOrientationCorrector:
                 # Flip the text upside-down (reverse the text and handle newlines)
                 lines = cell.split('\n')
                 flipped_lines = [line[::-1] for line in reversed(lines)]
-                self.app.table_data[row_idx][col_idx] = '\n'.join(flipped_lines)
+                row[col_idx] = '\n'.join(flipped_lines)
         
         self.corrected_table_data = self.app.table_data
                 
@@ -214,17 +237,11 @@ class TextOrientationCorrector:
             messagebox.showinfo("Information", "No original data to restore.")
             return
             
-        # Restore original data
-        self.app.table_data = [row[:] for row in self.original_table_data]
+        # Restore original data (as lists again, since corrections edit rows in place)
+        self.app.table_data = [list(row) for row in self.original_table_data]
         
         # Display the original data
-        csv_data = ""
-        for row in self.app.table_data:
-            csv_data += ",".join(f'"{cell}"' if cell else "" for cell in row) + "\n"
-        
-        # Display in the text output area
-        self.app.text_output.delete(1.0, "end")
-        self.app.text_output.insert("end", csv_data)
+        show_table_output(self.app, self.app.table_data)
         
         self.app.status_label.config(text="Restored original text orientation")
         
@@ -242,32 +259,25 @@ class TextOrientationCorrector:
             # Extract text with direction information
             text_dict = page.get_text("dict")
             
+            # Collect the spans of all text blocks
+            spans = list(chain.from_iterable(
+                line["spans"]
+                for block in text_dict["blocks"] if block["type"] == 0  # Text block
+                for line in block["lines"]
+            ))
+            total_spans = len(spans)
+            
             # Analyze text spans for direction flags
-            vertical_spans = 0
-            rtl_spans = 0
-            total_spans = 0
+            dir_flags = [span.get("dir", (0, 0, 0)) for span in spans]
+            rtl_spans = sum(1 for flags in dir_flags if flags[0] < 0)  # Negative x direction = RTL
+            vertical_spans = sum(1 for flags in dir_flags if flags[1] < 0)  # Negative y direction = TTB
             
-            for block in text_dict["blocks"]:
-                if block["type"] == 0:  # Text block
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            total_spans += 1
-                            
-                            # Check direction information
-                            dir_flags = span.get("dir", [0, 0, 0])
-                            if dir_flags[0] < 0:  # Negative x direction = RTL
-                                rtl_spans += 1
-                            if dir_flags[1] < 0:  # Negative y direction = TTB (top-to-bottom)
-                                vertical_spans += 1
-                                
-                            # Also check for spans with unusual bbox dimensions
-                            bbox = span.get("bbox", [0, 0, 0, 0])
-                            if bbox:
-                                width = bbox[2] - bbox[0]
-                                height = bbox[3] - bbox[1]
-                                # If significantly taller than wide, likely vertical text
-                                if height > width * 3 and height > 20:  # Avoid tiny spans
-                                    vertical_spans += 1
+            # Also count spans with unusual bbox dimensions: if significantly taller
+            # than wide, likely vertical text (avoiding tiny spans)
+            vertical_spans += sum(
+                1 for x0, y0, x1, y1 in (span.get("bbox") or (0, 0, 0, 0) for span in spans)
+                if (height := y1 - y0) > 20 and height > (x1 - x0) * 3
+            )
             
             # Calculate percentages
             if total_spans > 0:
@@ -5,6 +5,8 @@ This module defines the PDFTableExtractorApp class, which serves as the central
 controller for the application, integrating all UI components and core functionality.
 """
 
+from functools import partial
+
 from .toolbar import create_toolbar
 from .main_area import create_main_area
 from .status_bar import create_status_bar
@@ -56,7 +58,7 @@ class PDFTableExtractorApp:
         self.column_markers = []
         self.row_markers = []
         self.selection_mode = None
-        self.table_data = []
+        self.table_data = []  # Always rectangular: every row has the same number of cells
         
         # Area selection variables
         self.selection_start = None
@@ -87,23 +89,23 @@ class PDFTableExtractorApp:
     
     def setup_keyboard_shortcuts(self):
         """Set up keyboard shortcuts for common actions."""
-        self.root.bind('<Control-o>', lambda e: self.pdf_handler.open_pdf())
-        self.root.bind('<Control-s>', lambda e: self.table_extractor.save_extracted_text('csv'))
-        self.root.bind('<Control-e>', lambda e: self.table_extractor.save_extracted_text('excel'))
-        self.root.bind('<Control-z>', lambda e: self.marker_manager.undo_last_marker())
-        self.root.bind('<Control-l>', lambda e: self.pdf_handler.load_pdf())
-        self.root.bind('<Left>', lambda e: self.pdf_handler.prev_page())
-        self.root.bind('<Right>', lambda e: self.pdf_handler.next_page())
-        self.root.bind('<Control-plus>', lambda e: self.pdf_handler.zoom_in())
-        self.root.bind('<Control-minus>', lambda e: self.pdf_handler.zoom_out())
+        # Each action with the key sequences that trigger it (Command variants are for Mac users)
+        shortcuts = [
+            (('<Control-o>', '<Command-o>'), self.pdf_handler.open_pdf),
+            (('<Control-s>', '<Command-s>'), partial(self.table_extractor.save_extracted_text, 'csv')),
+            (('<Control-e>', '<Command-e>'), partial(self.table_extractor.save_extracted_text, 'excel')),
+            (('<Control-z>', '<Command-z>'), self.marker_manager.undo_last_marker),
+            (('<Left>',), self.pdf_handler.prev_page),
+            (('<Right>',), self.pdf_handler.next_page),
+            (('<Control-plus>', '<Command-plus>'), self.pdf_handler.zoom_in),
+            (('<Control-minus>', '<Command-minus>'), self.pdf_handler.zoom_out),
+        ]
         
-        # For Mac users
-        self.root.bind('<Command-o>', lambda e: self.pdf_handler.open_pdf())
-        self.root.bind('<Command-s>', lambda e: self.table_extractor.save_extracted_text('csv'))
-        self.root.bind('<Command-e>', lambda e: self.table_extractor.save_extracted_text('excel'))
-        self.root.bind('<Command-z>', lambda e: self.marker_manager.undo_last_marker())
-        self.root.bind('<Command-plus>', lambda e: self.pdf_handler.zoom_in())
-        self.root.bind('<Command-minus>', lambda e: self.pdf_handler.zoom_out())
+        # One handler per action, shared by all of its key sequences
+        for sequences, action in shortcuts:
+            handler = lambda event, action=action: action()
+            for sequence in sequences:
+                self.root.bind(sequence, handler)
     
     def set_selection_mode(self, mode):
         """
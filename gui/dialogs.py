@@ -9,6 +9,22 @@ import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
 from PIL import ImageTk
 
+class _ProgressBar:
+    """
+    A progress bar drawn as a rectangle on a canvas, resized as progress is made.
+    """
+    
+    def __init__(self, canvas):
+        """
+        Draw the empty progress bar.
+        
+        Args:
+            canvas: The canvas to draw the bar on
+        """
+        self.canvas = canvas
+        self.rect = canvas.create_rectangle(0, 0, 0, 20, fill="lightgreen", outline="", tags="progress")
+        self.width = None  # Canvas width, known once the dialog has been laid out
+
 def create_multipage_options_dialog(app):
     """
     Create a dialog for configuring multi-page table extraction options.
@@ -108,8 +124,14 @@ def create_progress_dialog(app, title, message):
     progress_frame = tk.Frame(progress_window, height=20, bd=1, relief=tk.SUNKEN)
     progress_frame.pack(fill=tk.X, padx=20, pady=10)
     
-    progress_bar = tk.Canvas(progress_frame, height=20, bg="white", highlightthickness=0)
-    progress_bar.pack(fill=tk.X, expand=True)
+    progress_canvas = tk.Canvas(progress_frame, height=20, bg="white", highlightthickness=0)
+    progress_canvas.pack(fill=tk.X, expand=True)
+    
+    # The bar is drawn once and only resized as progress is made
+    progress_bar = _ProgressBar(progress_canvas)
+    
+    # Show the dialog once here, so progress updates only need to redraw it
+    progress_window.update()
     
     return progress_window, progress_label, progress_bar
 
@@ -118,21 +140,25 @@ def update_progress(progress_bar, progress_label, message, progress_ratio):
     Update the progress bar and message in a progress dialog.
     
     Args:
-        progress_bar: The canvas progress bar
+        progress_bar: The progress bar returned by create_progress_dialog
         progress_label: The label showing the progress message
         message: The new message to display
         progress_ratio: The progress ratio (0.0 to 1.0)
     """
-    progress_bar.delete("progress")
-    progress_bar.create_rectangle(
-        0, 0, progress_bar.winfo_width() * progress_ratio, 20,
-        fill="lightgreen", outline="", tags="progress"
-    )
+    canvas = progress_bar.canvas
+    
+    # The width stays fixed after layout; before that the canvas reports 1 pixel
+    width = progress_bar.width
+    if width is None:
+        width = canvas.winfo_width()
+        if width > 1:
+            progress_bar.width = width
+    
+    canvas.coords(progress_bar.rect, 0, 0, width * progress_ratio, 20)
     progress_label.config(text=message)
     
-    # Force update of the progress display
-    progress_bar.update()
-    progress_label.update()
+    # Redraw the progress display without handling other pending events
+    canvas.update_idletasks()
 
 def create_image_view_dialog(app, image, title="Processed Image", has_detection=False, detection_image=None):
     """
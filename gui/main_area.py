@@ -7,6 +7,13 @@ including the PDF canvas and text output panel.
 
 import tkinter as tk
 import sys
+from utils.exporters import format_csv
+
+# Tables with more rows than this are only partly shown in the text output panel
+_OUTPUT_MAX_ROWS = 10000
+
+# The number of rows shown for such tables
+_OUTPUT_PREVIEW_ROWS = 1000
 
 def create_main_area(app):
     """
@@ -61,7 +68,7 @@ def create_main_area(app):
     text_scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
     
     # Text widget with scrollbars
-    app.text_output = tk.Text(text_frame, wrap=tk.NONE, 
+    app.text_output = tk.Text(text_frame, wrap=tk.NONE, state=tk.DISABLED,
                             xscrollcommand=text_scroll_x.set,
                             yscrollcommand=text_scroll_y.set)
     app.text_output.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -131,6 +138,28 @@ def create_main_area(app):
                 pass
 
 # Event handler functions
+def show_table_output(app, table):
+    """
+    Show table data as CSV in the text output panel.
+    
+    Very large tables are cut short in the panel; the full data stays in app.table_data.
+    
+    Args:
+        app: The PDFTableExtractorApp instance
+        table: A 2D list containing the table data
+    """
+    if len(table) > _OUTPUT_MAX_ROWS:
+        hidden = len(table) - _OUTPUT_PREVIEW_ROWS
+        text = format_csv(table[:_OUTPUT_PREVIEW_ROWS]) + f"...({hidden} rows hidden)...\n"
+    else:
+        text = format_csv(table)
+    
+    # The panel is read-only, so it is only enabled while its text is replaced
+    app.text_output.configure(state=tk.NORMAL)
+    app.text_output.delete(1.0, tk.END)
+    app.text_output.insert(tk.END, text)
+    app.text_output.configure(state=tk.DISABLED)
+
 def _on_canvas_click(app, event):
     """Handle mouse click events on the canvas."""
     if not app.selection_mode or not app.pdf_document:
@@ -141,21 +170,11 @@ def _on_canvas_click(app, event):
     y = int(app.canvas.canvasy(event.y) / app.zoom_factor)
     
     if app.selection_mode == 'column':
-        # Add column marker
-        if x not in app.column_markers:
-            # Add to history for undo
-            app.marker_history.append({'type': 'column', 'value': x})
-            # Add column marker
-            app.column_markers.append(x)
-            app.column_markers.sort()  # Keep markers in order
+        # Add column marker (drawn by the marker manager)
+        app.marker_manager.add_marker('column', x)
     elif app.selection_mode == 'row':
-        # Add row marker
-        if y not in app.row_markers:
-            # Add to history for undo
-            app.marker_history.append({'type': 'row', 'value': y})
-            # Add row marker
-            app.row_markers.append(y)
-            app.row_markers.sort()  # Keep markers in order
+        # Add row marker (drawn by the marker manager)
+        app.marker_manager.add_marker('row', y)
     elif app.selection_mode == 'area':
         # Start area selection
         app.selection_start = (x, y)
@@ -164,9 +183,9 @@ def _on_canvas_click(app, event):
         # Bind motion and release events for drag operation
         app.canvas.bind("<B1-Motion>", lambda e: _on_canvas_drag(app, e))
         app.canvas.bind("<ButtonRelease-1>", lambda e: _on_canvas_release(app, e))
-    
-    # Redraw markers
-    app.marker_manager.redraw_markers()
+        
+        # Draw the (still empty) selection rectangle
+        app.marker_manager.draw_area_selection()
 
 def _on_canvas_drag(app, event):
     """Handle mouse drag for area selection."""
@@ -180,8 +199,8 @@ def _on_canvas_drag(app, event):
     # Update end point of selection
     app.selection_end = (x, y)
     
-    # Redraw to show updated selection rectangle
-    app.marker_manager.redraw_markers()
+    # Redraw only the selection rectangle; the markers have not changed
+    app.marker_manager.draw_area_selection()
 
 def _on_canvas_release(app, event):
     """Handle mouse release after area selection."""
@@ -214,7 +233,7 @@ def _on_canvas_release(app, event):
     app.status_label.config(text=f"Area selected: {width}x{height} pixels")
     
     # Redraw to show the final selection
-    app.marker_manager.redraw_markers()
+    app.marker_manager.draw_area_selection()
     
     # Unbind motion and release events
     app.canvas.unbind("<B1-Motion>")
@@ -5,4 +5,4 @@ This package contains utility modules that provide common functionality
 used across the application, such as exporting data to various formats.
 """
 
-from .exporters import export_to_csv, export_to_excel
\ No newline at end of file
+from .exporters import export_to_csv, export_to_excel, format_csv, write_csv, write_excel
\ No newline at end of file
@@ -5,8 +5,68 @@ This module provides functions for exporting extracted table data to various
 file formats, including CSV and Excel.
 """
 
+import csv
+import io
 from tkinter import filedialog, messagebox
 
+# Name of the worksheet holding the table in exported Excel files
+_EXCEL_SHEET_NAME = 'Extracted Table'
+
+def write_csv(file, table_data):
+    """
+    Write table data as CSV to an open text file.
+    
+    Every cell is quoted, so commas, quotes and newlines within cells are kept intact.
+    
+    Args:
+        file: A text file object, opened with newline=''
+        table_data: A 2D list containing the table data
+    """
+    writer = csv.writer(file, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+    writer.writerows(table_data)
+
+def format_csv(table_data):
+    """
+    Format table data as CSV text, as shown in the output area.
+    
+    Args:
+        table_data: A 2D list containing the table data
+        
+    Returns:
+        str: The CSV text, one line per row
+    """
+    buffer = io.StringIO()
+    write_csv(buffer, table_data)
+    return buffer.getvalue()
+
+def write_excel(file_path, table_data):
+    """
+    Write table data to an Excel workbook.
+    
+    Rows are streamed into a write-only openpyxl workbook, which does not keep the
+    cells in memory. pandas is only used when openpyxl is not installed.
+    
+    Args:
+        file_path: The path of the .xlsx file to write
+        table_data: A 2D list containing the table data
+        
+    Raises:
+        ImportError: If no Excel writer is installed
+    """
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        import pandas as pd
+        
+        pd.DataFrame(table_data).to_excel(file_path, sheet_name=_EXCEL_SHEET_NAME, index=False, header=False)
+        return
+    
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(_EXCEL_SHEET_NAME)
+    for row in table_data:
+        sheet.append(row)
+    workbook.save(file_path)
+
 def export_to_csv(table_data, parent_window=None, suggested_filename=None):
     """
     Export table data to a CSV file.
@@ -41,21 +101,8 @@ def export_to_csv(table_data, parent_window=None, suggested_filename=None):
         return False  # User cancelled
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            for row in table_data:
-                # Format each cell (quote if contains commas or quotes)
-                formatted_row = []
-                for cell in row:
-                    cell_str = str(cell) if cell is not None else ""
-                    if ',' in cell_str or '"' in cell_str:
-                        # Escape quotes and wrap in quotes
-                        cell_str = '"' + cell_str.replace('"', '""') + '"'
-                    elif cell_str == "":
-                        cell_str = '""'  # Empty cells as empty quotes
-                    formatted_row.append(cell_str)
-                
-                # Write the row to the file
-                f.write(",".join(formatted_row) + "\n")
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            write_csv(f, table_data)
         
         return True
     except Exception as e:
@@ -96,36 +143,15 @@ def export_to_excel(table_data, parent_window=None, suggested_filename=None):
         return False  # User cancelled
     
     try:
-        # Check if pandas and openpyxl are available
-        try:
-            import pandas as pd
-            import openpyxl
-        except ImportError as e:
-            if "pandas" in str(e):
-                messagebox.showerror(
-                    "Error", 
-                    "The pandas package is required for Excel export.\n\nPlease run: pip install pandas openpyxl", 
-                    parent=parent_window
-                )
-                return False
-            elif "openpyxl" in str(e):
-                messagebox.showerror(
-                    "Error", 
-                    "The openpyxl package is required for Excel export.\n\nPlease run: pip install openpyxl", 
-                    parent=parent_window
-                )
-                return False
-            else:
-                raise e
-        
-        # Convert table data to pandas DataFrame
-        df = pd.DataFrame(table_data)
-        
-        # Write DataFrame to Excel
-        with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Extracted Table', index=False, header=False)
-        
+        write_excel(file_path, table_data)
         return True
+    except ImportError:
+        messagebox.showerror(
+            "Error", 
+            "The openpyxl package is required for Excel export.\n\nPlease run: pip install openpyxl", 
+            parent=parent_window
+        )
+        return False
     except Exception as e:
         messagebox.showerror("Error", f"Failed to save Excel file: {str(e)}", parent=parent_window)
         return False
\ No newline at end of file